@@ -0,0 +1,132 @@
+# async_fetch.py
+# Description: asyncio fetch layer for the compiler options scraper
+        # Fetches pages with a total deadline per request, retries with jittered exponential backoff
+        # and a bounded number of concurrent connections over one pooled `requests.Session`
+        # Blocking requests run in worker threads, so no additional dependency is needed
+
+import asyncio
+import random
+import time
+from typing import Optional, List, Dict, Iterable, Mapping, NamedTuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+MAX_CONNECTIONS = 4
+TIMEOUT = 10.0
+RETRIES = 3
+BACKOFF = 0.5
+CHUNK_SIZE = 64 * 1024
+# responses worth another attempt: rate limiting and server side errors
+RETRY_STATUS = frozenset((429, 500, 502, 503, 504))
+
+
+class Page(NamedTuple):
+    """Downloaded page with the fields of `requests.Response` that the scraper uses."""
+    url: str
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+    encoding: str
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+
+class AsyncFetcher:
+    """Fetch URLs concurrently with timeouts, retries and a bounded connection pool."""
+
+    def __init__(self, max_connections: int = MAX_CONNECTIONS, timeout: float = TIMEOUT,
+                 retries: int = RETRIES, backoff: float = BACKOFF):
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections,
+                              pool_block=True)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # created lazily, it must belong to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "AsyncFetcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _get(self, url: str, headers: Optional[Dict[str, str]], deadline: float) -> Page:
+        """Download the URL in a worker thread, giving up once the deadline has passed."""
+        def remaining() -> float:
+            # urllib3 rejects a timeout of 0, so an expired deadline is reported here
+            seconds = deadline - time.monotonic()
+            if seconds <= 0:
+                raise requests.Timeout(f"Download exceeded {self.timeout}s")
+            return seconds
+
+        # the requests timeout applies to every single read, a server sending a few bytes at
+        # a time would never trigger it, so the body is read in chunks against the deadline
+        response = self.session.get(url, headers=headers, stream=True, timeout=remaining())
+        try:
+            body = []
+            # read1() returns what has arrived instead of waiting for a full chunk
+            while chunk := response.raw.read1(CHUNK_SIZE, decode_content=True):
+                remaining()
+                body.append(chunk)
+        finally:
+            # returns the connection to the pool, or drops it if the body was not read
+            response.close()
+        return Page(response.url, response.status_code, response.headers, b"".join(body),
+                    response.encoding or "utf-8")
+
+    def _delay(self, attempt: int) -> float:
+        """Full jitter backoff: a random delay up to backoff * 2 ** attempt seconds."""
+        return random.uniform(0, self.backoff * 2 ** attempt)
+
+    async def fetch(self, url: str, headers: Optional[Dict[str, str]] = None) \
+            -> Optional[Page]:
+        """Fetch the URL, return None if every attempt failed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+            self._loop = loop
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(self._delay(attempt - 1))
+            try:
+                async with self._semaphore:
+                    deadline = time.monotonic() + self.timeout
+                    # the worker thread cannot be cancelled, it stops itself at the deadline
+                    response = await asyncio.wait_for(
+                        asyncio.to_thread(self._get, url, headers, deadline), self.timeout)
+            except asyncio.TimeoutError:
+                print(f"Attempt {attempt + 1} to fetch {url} failed: no response within "
+                      f"{self.timeout}s")
+                continue
+            except requests.RequestException as error:
+                print(f"Attempt {attempt + 1} to fetch {url} failed: {error}")
+                continue
+            if response.status_code not in RETRY_STATUS:
+                return response
+            print(f"Attempt {attempt + 1} to fetch {url} failed: HTTP {response.status_code}")
+        return None
+
+    async def fetch_all(self, urls: Iterable[str]) -> List[Optional[Page]]:
+        """Fetch all URLs concurrently, results are in the order of the URLs."""
+        return await asyncio.gather(*(self.fetch(url) for url in urls))
+
+    def request(self, url: str, headers: Optional[Dict[str, str]] = None) \
+            -> Page:
+        """Blocking drop-in for `requests.get`, as used by main()."""
+        response = asyncio.run(self.fetch(url, headers))
+        if response is None:
+            raise requests.ConnectionError(f"Unable to fetch {url} after {self.retries + 1} attempts")
+        return response
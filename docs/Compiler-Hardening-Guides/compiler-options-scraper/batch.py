@@ -0,0 +1,151 @@
+# batch.py
+# Description: Batch mode of the compiler options scraper
+        # Converts many revisions of the OpenSSF Compiler Options Hardening Guide, given as
+        # local HTML files or URLs, to one versioned JSON file per revision plus a merged index
+        # URLs are fetched with the asyncio fetch layer of `async_fetch.py` (bounded connection
+        # pool, timeouts and retries) and the documents are parsed in a process pool
+
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple
+
+from async_fetch import AsyncFetcher, RETRIES, TIMEOUT
+from db_diff import HashedDB
+from main import DEFAULT_PARSER, PARSER_BACKENDS, html_to_db, parser_available, write_db
+
+
+INDEX_FILE = "index.json"
+FETCH_WORKERS = 4
+
+
+def is_url(source: str) -> bool:
+    """Check whether the source is a URL rather than a local file."""
+    return source.startswith(("http://", "https://"))
+
+
+def read_file(path: str) -> str:
+    """Return the content of a local file, runs in a worker thread."""
+    with open(path, "r", encoding="utf-8") as fp:
+        return fp.read()
+
+
+async def read_source(source: str, fetcher: AsyncFetcher) -> Optional[str]:
+    """Return the HTML content of a local file or URL."""
+    if not is_url(source):
+        # a blocking read would stall the downloads running on the event loop
+        return await asyncio.to_thread(read_file, source)
+    response = await fetcher.fetch(source)
+    if response is not None and response.status_code == 200:
+        return response.text
+    print("Failed to fetch HTML content:", source)
+    return None
+
+
+def parse_revision(html: str, parser: str) -> Optional[Dict[str, Any]]:
+    """Convert one revision to the DB format, runs in a worker process."""
+    return html_to_db(html, parser)
+
+
+def revision_file(version: str) -> str:
+    """Name of the JSON file for the given revision."""
+    return f"compiler-options-{version}.json"
+
+
+async def fetch_and_parse(sources: List[str], parser: str, fetcher: AsyncFetcher,
+                          parsers: ProcessPoolExecutor) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+    """Fetch every source and parse it in the process pool as soon as it has arrived."""
+    loop = asyncio.get_running_loop()
+
+    async def scrape(source: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        try:
+            html = await read_source(source, fetcher)
+            if html is None:
+                return source, None
+            return source, await loop.run_in_executor(parsers, parse_revision, html, parser)
+        except Exception as error:
+            # one broken source must not abort the other revisions of the batch
+            print("Failed to scrape", source + ":", repr(error))
+            return source, None
+
+    # results are in input order, so that the first of several sources of a revision wins
+    return await asyncio.gather(*(scrape(source) for source in sources))
+
+
+def scrape_revisions(sources: List[str], output_dir: str, parser: str = DEFAULT_PARSER,
+                     fetch_workers: int = FETCH_WORKERS,
+                     parse_workers: Optional[int] = None,
+                     fetcher: Optional[AsyncFetcher] = None) -> Dict[str, Any]:
+    """Scrape every source and write one DB per revision and the merged index."""
+    os.makedirs(output_dir, exist_ok=True)
+    index: Dict[str, Any] = {}
+
+    own_fetcher = fetcher is None
+    if own_fetcher:
+        fetcher = AsyncFetcher(max_connections=fetch_workers)
+    try:
+        with ProcessPoolExecutor(max_workers=parse_workers) as parsers:
+            results = asyncio.run(fetch_and_parse(sources, parser, fetcher, parsers))
+    finally:
+        if own_fetcher:
+            fetcher.close()
+
+    for source, db in results:
+        if db is None:
+            print("Skipping source without options data:", source)
+            continue
+        version = db["version"]
+        if not version:
+            print("Skipping revision without version date:", source)
+            continue
+        if version in index:
+            print("Skipping duplicate revision", version, "from", source)
+            continue
+        write_db(db, os.path.join(output_dir, revision_file(version)))
+        index[version] = {
+            "source": source,
+            "file": revision_file(version),
+            "recommended": len(db["options"]["recommended"]),
+            # equal digests mean an unchanged recommended set, see db_diff.py
+            "digest": HashedDB(db).digest,
+        }
+
+    index = {version: index[version] for version in sorted(index)}
+    with open(os.path.join(output_dir, INDEX_FILE), "w") as fp:
+        json.dump({"revisions": index}, fp, indent=4)
+        print("Write revision index in json to:", os.path.join(output_dir, INDEX_FILE))
+    return index
+
+
+def main():
+    """Parse the command line and run the batch."""
+    arg_parser = argparse.ArgumentParser(
+        description="Scrape compiler options from many revisions of the OpenSSF guide")
+    arg_parser.add_argument("sources", nargs="+", help="local HTML files or URLs")
+    arg_parser.add_argument("--output-dir", default="revisions",
+                            help="directory for the per-revision JSON files (default: %(default)s)")
+    arg_parser.add_argument("--parser", choices=PARSER_BACKENDS, default=DEFAULT_PARSER,
+                            help="HTML parser backend (default: %(default)s)")
+    arg_parser.add_argument("--fetch-workers", type=int, default=FETCH_WORKERS,
+                            help="concurrent downloads (default: %(default)s)")
+    arg_parser.add_argument("--parse-workers", type=int, default=None,
+                            help="parser processes (default: number of CPUs)")
+    arg_parser.add_argument("--timeout", type=float, default=TIMEOUT,
+                            help="seconds per request, including the download "
+                                 "(default: %(default)s)")
+    arg_parser.add_argument("--retries", type=int, default=RETRIES,
+                            help="retries of failed requests (default: %(default)s)")
+    args = arg_parser.parse_args()
+    if not parser_available(args.parser):
+        arg_parser.error(f"parser backend {args.parser} is not installed, "
+                         f"try: pip install {args.parser}")
+    with AsyncFetcher(max_connections=args.fetch_workers, timeout=args.timeout,
+                      retries=args.retries) as fetcher:
+        scrape_revisions(args.sources, args.output_dir, args.parser,
+                         args.fetch_workers, args.parse_workers, fetcher)
+
+
+if __name__ == "__main__":
+    main()
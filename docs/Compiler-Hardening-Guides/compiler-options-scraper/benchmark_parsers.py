@@ -0,0 +1,58 @@
+# benchmark_parsers.py
+# Description: Compare the parser backends of the compiler options scraper on a saved copy
+        # of the guide HTML page
+        # Checks that every backend produces byte-identical JSON output and reports the best
+        # time out of several runs for each backend
+
+import argparse
+import json
+import time
+from typing import Dict, Optional
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+from main import PARSER_BACKENDS, html_to_db, soup_to_db
+
+
+def full_tree_to_db(html: str) -> Dict:
+    """Reference conversion: full html.parser tree, as the scraper originally did."""
+    return soup_to_db(BeautifulSoup(html, 'html.parser'))
+
+
+def time_backend(html: str, parser: Optional[str], repeat: int) -> Dict:
+    """Return the best time and the JSON output of the given backend."""
+    best = float("inf")
+    output = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        db = full_tree_to_db(html) if parser is None else html_to_db(html, parser)
+        best = min(best, time.perf_counter() - start)
+        output = json.dumps(db, indent=4)
+    return {"time": best, "output": output}
+
+
+def main():
+    """Time every available backend and compare the output with the reference."""
+    arg_parser = argparse.ArgumentParser(description="Benchmark the scraper parser backends")
+    arg_parser.add_argument("html_file", help="saved copy of the guide HTML page")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="runs per backend")
+    args = arg_parser.parse_args()
+
+    with open(args.html_file, "r", encoding="utf-8") as fp:
+        html = fp.read()
+
+    reference = time_backend(html, None, args.repeat)
+    print(f"{'full tree (reference)':<22} {reference['time'] * 1000:9.2f} ms")
+    for parser in PARSER_BACKENDS:
+        try:
+            result = time_backend(html, parser, args.repeat)
+        except FeatureNotFound:
+            print(f"{parser:<22} not installed")
+            continue
+        identical = "identical" if result["output"] == reference["output"] else "DIFFERS"
+        speedup = reference["time"] / result["time"]
+        print(f"{parser:<22} {result['time'] * 1000:9.2f} ms  x{speedup:5.1f}  {identical}")
+
+
+if __name__ == "__main__":
+    main()
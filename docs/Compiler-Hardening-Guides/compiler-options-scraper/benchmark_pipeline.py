@@ -0,0 +1,110 @@
+# benchmark_pipeline.py
+# Description: Offline benchmark of the compiler options scraper pipeline
+        # Serves a fixture from `corpus.py` on a local HTTP server and times the fetch, parse,
+        # table extraction, version extraction and serialization stages separately, reporting
+        # the peak memory allocated by each stage
+        # Use `--rows` for the synthetically enlarged guide and `--json` to keep a baseline
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Dict, Any, Tuple
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+import corpus
+from main import (DEFAULT_PARSER, PARSER_BACKENDS, convert_to_json,
+                  extract_version_from_subtitle, fetch_document, table_to_dicts)
+from table_locator import locate_tables
+from table_stream import stream_tables
+
+STAGES = ("fetch", "parse", "tables", "versions", "serialize")
+
+
+def measure_time(function: Callable[[], Any]) -> Tuple[Any, float]:
+    """Run the function and return its result and run time."""
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def measure_memory(function: Callable[[], Any]) -> Tuple[Any, int]:
+    """Run the function and return its result and peak allocated memory."""
+    tracemalloc.start()
+    try:
+        result = function()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_pipeline(url: str, parser: str,
+                 measure: Callable[[Callable[[], Any]], Tuple[Any, float]]) -> Dict[str, float]:
+    """Run every stage of the scraper once and return the measurement of every stage."""
+    stats = {}
+    html, stats["fetch"] = measure(lambda: fetch_document(url))
+
+    if parser == "stream":
+        # the event-driven backend extracts the tables while parsing
+        extractor, stats["parse"] = measure(lambda: stream_tables(html))
+        table_data, stats["tables"] = measure(lambda: extractor.tables["recommended"])
+        version = extract_version_from_subtitle(extractor.first_paragraph)
+    else:
+        only = SoupStrainer(['p', 'table'])
+        soup, stats["parse"] = measure(lambda: BeautifulSoup(html, parser, parse_only=only))
+        table_data, stats["tables"] = measure(
+            lambda: [row for table in locate_tables(soup)["recommended"]
+                     for row in table_to_dicts(table)])
+        version = extract_version_from_subtitle(soup.find('p').get_text())
+
+    json_data, stats["versions"] = measure(lambda: convert_to_json(table_data))
+    output_db = {"version": version, "options": {"recommended": json_data}}
+    _, stats["serialize"] = measure(lambda: json.dumps(output_db, indent=4))
+    return stats
+
+
+def benchmark(html: str, parser: str, repeat: int) -> Dict[str, Dict[str, float]]:
+    """Best time of every stage over several runs and its peak memory."""
+    with corpus.serve({"/guide.html": html}) as base_url:
+        url = base_url + "/guide.html"
+        runs: List[Dict[str, float]] = [run_pipeline(url, parser, measure_time)
+                                        for _ in range(repeat)]
+        # tracing allocations slows the stages down, so memory is measured in a separate run
+        memory = run_pipeline(url, parser, measure_memory)
+    return {stage: {"seconds": min(run[stage] for run in runs), "peak_bytes": memory[stage]}
+            for stage in STAGES}
+
+
+def main():
+    """Benchmark the pipeline on the fixture corpus and print the results."""
+    arg_parser = argparse.ArgumentParser(description="Benchmark the scraper pipeline offline")
+    arg_parser.add_argument("--fixture", default=corpus.GUIDE_FIXTURE,
+                            help="fixture file in the fixtures directory (default: %(default)s)")
+    arg_parser.add_argument("--rows", type=int, default=0,
+                            help="enlarge the recommended tables to this many rows")
+    arg_parser.add_argument("--parser", choices=PARSER_BACKENDS, default=DEFAULT_PARSER,
+                            help="HTML parser backend (default: %(default)s)")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="runs per stage")
+    arg_parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = arg_parser.parse_args()
+
+    html = corpus.load_fixture(args.fixture)
+    if args.rows:
+        html = corpus.enlarge_guide(html, args.rows)
+    results = benchmark(html, args.parser, args.repeat)
+
+    if args.json:
+        json.dump({"fixture": args.fixture, "rows": args.rows, "parser": args.parser,
+                   "stages": results}, sys.stdout, indent=4)
+        print()
+        return
+    print(f"fixture {args.fixture}, {len(html)} bytes, parser {args.parser}")
+    for stage in STAGES:
+        print(f"{stage:<10} {results[stage]['seconds'] * 1000:9.2f} ms "
+              f"{results[stage]['peak_bytes'] / 1024:10.1f} KiB peak")
+
+
+if __name__ == "__main__":
+    main()
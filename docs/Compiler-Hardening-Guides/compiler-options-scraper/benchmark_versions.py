@@ -0,0 +1,69 @@
+# benchmark_versions.py
+# Description: Microbenchmark of the "Supported since" version extraction
+        # Compares the single-pass `extract_versions()` against the previous implementation
+        # running one `re.search` per dependency, on a synthetic table with many rows
+
+import argparse
+import random
+import re
+import timeit
+from typing import Dict, List
+
+from main import TOOLCHAINS, extract_versions
+
+
+def extract_versions_per_pattern(input_string: str) -> Dict[str, str]:
+    """Previous implementation: one regex search per dependency."""
+    version_patterns = {
+        'gcc': r'GCC\s+(\d+\.\d+\.\d)',
+        'clang': r'Clang\s+(\d+\.\d+\.\d)',
+        'binutils': r'Binutils\s+(\d+\.\d+\.\d)',
+        'libc++': r'libc\+\+\s+(\d+\.\d+\.\d)',
+        'libstdc++': r'libstdc\+\+\s+(\d+\.\d+\.\d)'
+    }
+
+    versions = {}
+    for key, pattern in version_patterns.items():
+        match = re.search(pattern, input_string)
+        if match:
+            versions[key] = match.group(1)
+
+    return versions
+
+
+def synthetic_cells(rows: int, seed: int = 0) -> List[str]:
+    """Generate "Supported since" cells the way they appear in the guide."""
+    rng = random.Random(seed)
+    labels = list(TOOLCHAINS)
+    cells = []
+    for _ in range(rows):
+        entries = []
+        for label in rng.sample(labels, rng.randint(1, 3)):
+            version = f"{rng.randint(2, 19)}.{rng.randint(0, 20)}.{rng.randint(0, 9)}"
+            # footnote references follow the version in some cells
+            entries.append(f"{label} {version}" + ("[1]" if rng.random() < 0.1 else ""))
+        cells.append(" ".join(entries))
+    return cells
+
+
+def main():
+    """Time both implementations over the same synthetic table."""
+    parser = argparse.ArgumentParser(description="Benchmark version extraction")
+    parser.add_argument("--rows", type=int, default=50000, help="rows in the synthetic table")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions")
+    args = parser.parse_args()
+
+    cells = synthetic_cells(args.rows)
+    for cell in cells:
+        if extract_versions(cell) != extract_versions_per_pattern(cell):
+            raise ValueError(f"Implementations disagree on: {cell!r}")
+
+    for name, function in (("per-pattern re.search", extract_versions_per_pattern),
+                           ("single-pass", extract_versions)):
+        best = min(timeit.repeat(lambda: [function(cell) for cell in cells],
+                                 number=1, repeat=args.repeat))
+        print(f"{name:<22} {best * 1000:9.2f} ms for {args.rows} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# corpus.py
+# Description: Offline fixture corpus for the compiler options scraper
+        # Provides saved copies of the guide HTML page from the `fixtures` directory, a
+        # synthetically enlarged variant with thousands of table rows and a local HTTP server
+        # to exercise the scraper pipeline without network access
+
+import argparse
+import http.server
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+GUIDE_FIXTURE = "guide-2026-06-30.html"
+GUIDE_MARKDOWN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              "Compiler-Options-Hardening-Guide-for-C-and-C++.md")
+# NOTE: tables 1 and 2 contain the recommended options
+ENLARGED_TABLES = (1, 2)
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en-US">
+<head>
+<meta charset="UTF-8">
+<title>Compiler Options Hardening Guide for C and C++ | OpenSSF Best Practices Working Group</title>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+def load_fixture(name: str = GUIDE_FIXTURE) -> str:
+    """Return the content of a saved HTML page from the fixtures directory."""
+    with open(os.path.join(FIXTURES_DIR, name), "r", encoding="utf-8") as fp:
+        return fp.read()
+
+
+def enlarge_guide(html: str, rows: int) -> str:
+    """Repeat the rows of the recommended options tables until they hold `rows` rows in total.
+
+    Every copy gets a numeric suffix on its first flag, so that the flags stay unique.
+    """
+    tables = re.split(r'(?=<table)', html)
+    # tables[0] is the text before the first table
+    originals = {index: re.findall(r'<tr>.*?</tr>', tables[index + 1].split('<tbody>', 1)[1],
+                                   re.S)
+                 for index in ENLARGED_TABLES}
+    total = sum(len(body_rows) for body_rows in originals.values())
+    copies = max(rows - total, 0)
+    for position, index in enumerate(ENLARGED_TABLES):
+        body_rows = originals[index]
+        # split the additional rows evenly over the tables
+        count = copies // len(ENLARGED_TABLES) + (position < copies % len(ENLARGED_TABLES))
+        extra = [re.sub(r'</code>', f'-{copy}</code>', body_rows[copy % len(body_rows)], count=1)
+                 for copy in range(count)]
+        tables[index + 1] = tables[index + 1].replace('</tbody>', '\n'.join(extra) + '\n</tbody>', 1)
+    return ''.join(tables)
+
+
+def render_guide(markdown_file: str = GUIDE_MARKDOWN) -> str:
+    """Render the guide markdown to HTML similar to the published page.
+
+    Requires the optional `markdown` package. Line breaks are written as `<br />`, as on
+    the published page.
+    """
+    import markdown  # only needed to regenerate the fixtures
+    with open(markdown_file, "r", encoding="utf-8") as fp:
+        body = markdown.markdown(fp.read(), extensions=["tables", "footnotes", "fenced_code"])
+    return PAGE_TEMPLATE.format(body=re.sub(r'<br\s*/?>', '<br />', body))
+
+
+@contextmanager
+def serve(documents: Dict[str, str]) -> Iterator[str]:
+    """Serve the given documents, keyed by path, on a local HTTP server.
+
+    Yields the base URL of the server, e.g. "http://127.0.0.1:8000".
+    """
+    encoded = {path: content.encode("utf-8") for path, content in documents.items()}
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = encoded.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    """Regenerate the guide fixture from the markdown source."""
+    parser = argparse.ArgumentParser(description="Regenerate the scraper fixture corpus")
+    parser.add_argument("--markdown", default=GUIDE_MARKDOWN, help="guide markdown source")
+    parser.add_argument("--output", default=os.path.join(FIXTURES_DIR, GUIDE_FIXTURE),
+                        help="output HTML file (default: %(default)s)")
+    args = parser.parse_args()
+    with open(args.output, "w", encoding="utf-8") as fp:
+        fp.write(render_guide(args.markdown))
+    print("Write guide fixture to:", args.output)
+
+
+if __name__ == "__main__":
+    main()
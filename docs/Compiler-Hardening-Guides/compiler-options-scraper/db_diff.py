@@ -0,0 +1,119 @@
+# db_diff.py
+# Description: Diff between versions of the compiler options DB (`compiler-options.json`)
+        # Entries are keyed on `opt` and reported as added, removed or changed, with description,
+        # prerequisite and `requires` version changes per flag
+        # Every DB is reduced to one content hash per flag and one digest for the whole set,
+        # so unchanged revisions are skipped in O(1) and changed ones compared in linear time
+
+import argparse
+import hashlib
+import json
+import sys
+from typing import List, Dict, Any
+
+
+CATEGORY = "recommended"
+
+
+def entry_hash(entry: Dict[str, Any]) -> str:
+    """Hash of an options entry, independent of the key order."""
+    return hashlib.sha256(json.dumps(entry, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class HashedDB:
+    """Compiler options DB indexed by flag with the content hash of every entry."""
+
+    def __init__(self, db: Dict[str, Any], category: str = CATEGORY):
+        self.version = db.get("version")
+        # NOTE: flags are assumed to be unique, a repeated flag overrides the earlier entry
+        self.entries = {entry["opt"]: entry for entry in db["options"].get(category, [])}
+        self.hashes = {opt: entry_hash(entry) for opt, entry in self.entries.items()}
+        digest = hashlib.sha256()
+        for opt in sorted(self.hashes):
+            digest.update(opt.encode("utf-8"))
+            digest.update(self.hashes[opt].encode("ascii"))
+        self.digest = digest.hexdigest()
+
+    @classmethod
+    def load(cls, db_file: str, category: str = CATEGORY) -> "HashedDB":
+        """Load and index a DB file."""
+        with open(db_file, "r") as fp:
+            return cls(json.load(fp), category)
+
+
+def diff_requires(old: Dict[str, str], new: Dict[str, str]) -> Dict[str, List[Any]]:
+    """Return [old, new] versions for every toolchain whose requirement changed."""
+    return {tool: [old.get(tool), new.get(tool)]
+            for tool in sorted(old.keys() | new.keys())
+            if old.get(tool) != new.get(tool)}
+
+
+def diff_entry(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Describe how a single flag changed between two DBs."""
+    changes: Dict[str, Any] = {}
+    for field in ("desc", "prereq"):
+        if old.get(field) != new.get(field):
+            changes[field] = [old.get(field), new.get(field)]
+    requires = diff_requires(old.get("requires", {}), new.get("requires", {}))
+    if requires:
+        changes["requires"] = requires
+    return changes
+
+
+def diff_dbs(old: HashedDB, new: HashedDB) -> Dict[str, Any]:
+    """Machine-readable diff between two indexed DBs."""
+    result: Dict[str, Any] = {
+        "from": old.version,
+        "to": new.version,
+        "changed": old.digest != new.digest,
+        "added": [],
+        "removed": [],
+        "modified": {},
+    }
+    if not result["changed"]:
+        return result
+
+    result["added"] = sorted(new.hashes.keys() - old.hashes.keys())
+    result["removed"] = sorted(old.hashes.keys() - new.hashes.keys())
+    for opt in sorted(old.hashes.keys() & new.hashes.keys()):
+        if old.hashes[opt] != new.hashes[opt]:
+            result["modified"][opt] = diff_entry(old.entries[opt], new.entries[opt])
+    return result
+
+
+def diff_files(old_file: str, new_file: str, category: str = CATEGORY) -> Dict[str, Any]:
+    """Diff two DB files."""
+    return diff_dbs(HashedDB.load(old_file, category), HashedDB.load(new_file, category))
+
+
+def diff_chain(db_files: List[str], category: str = CATEGORY) -> List[Dict[str, Any]]:
+    """Diff every DB file against its predecessor, loading each file only once."""
+    diffs = []
+    previous = None
+    for db_file in db_files:
+        current = HashedDB.load(db_file, category)
+        if previous is not None:
+            diffs.append(diff_dbs(previous, current))
+        previous = current
+    return diffs
+
+
+def main() -> int:
+    """Print the diff between consecutive DB files, exit with 1 if anything changed."""
+    parser = argparse.ArgumentParser(description="Diff compiler options DB files")
+    parser.add_argument("db_files", nargs="+", metavar="db_file",
+                        help="two or more DB files, oldest first")
+    parser.add_argument("--category", default=CATEGORY,
+                        help="options category to compare (default: %(default)s)")
+    args = parser.parse_args()
+    if len(args.db_files) < 2:
+        parser.error("at least two DB files are required")
+
+    diffs = diff_chain(args.db_files, args.category)
+    json.dump(diffs[0] if len(diffs) == 1 else diffs, sys.stdout, indent=4)
+    print()
+    return 1 if any(diff["changed"] for diff in diffs) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
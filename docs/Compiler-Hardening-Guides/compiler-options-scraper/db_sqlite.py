@@ -0,0 +1,134 @@
+# db_sqlite.py
+# Description: SQLite output format and lookup API for the compiler options DB
+        # Stores the options of `compiler-options.json` indexed by flag name and by the minimum
+        # version of every toolchain, so that build wrappers can query the flags supported by
+        # a toolchain without loading and scanning the whole JSON file
+        # Only depends on the standard library
+
+import argparse
+import json
+import os
+import pathlib
+import sqlite3
+from typing import Optional, List, Dict, Any
+
+from versions import version_key
+
+
+SQLITE_FILE = "compiler-options.db"
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE options (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    opt TEXT NOT NULL,
+    desc TEXT NOT NULL,
+    prereq TEXT
+);
+CREATE TABLE requires (
+    option_id INTEGER NOT NULL REFERENCES options(id),
+    tool TEXT NOT NULL,
+    version TEXT NOT NULL,
+    version_key INTEGER NOT NULL
+);
+CREATE INDEX options_opt ON options (opt);
+CREATE INDEX requires_tool_version ON requires (tool, version_key);
+CREATE INDEX requires_option ON requires (option_id);
+"""
+
+
+def write_sqlite(output_db: Dict[str, Any], sqlite_file: str = SQLITE_FILE) -> None:
+    """Write the compiler options DB to the given file as a SQLite database."""
+    # build into a temporary file and swap it in, readers never see a partial database
+    tmp_file = sqlite_file + ".tmp"
+    if os.path.exists(tmp_file):
+        os.remove(tmp_file)
+    connection = sqlite3.connect(tmp_file)
+    try:
+        with connection:
+            connection.executescript(SCHEMA)
+            connection.execute("INSERT INTO meta VALUES ('version', ?)", (output_db["version"],))
+            for category, entries in output_db["options"].items():
+                for entry in entries:
+                    cursor = connection.execute(
+                        "INSERT INTO options (category, opt, desc, prereq) VALUES (?, ?, ?, ?)",
+                        (category, entry["opt"], entry["desc"], entry.get("prereq")))
+                    connection.executemany(
+                        "INSERT INTO requires VALUES (?, ?, ?, ?)",
+                        [(cursor.lastrowid, tool, version, version_key(version))
+                         for tool, version in entry["requires"].items()])
+    finally:
+        connection.close()
+    os.replace(tmp_file, sqlite_file)
+    print("Write compiler options in sqlite to:", sqlite_file)
+
+
+class OptionsDB:
+    """Read-only lookup API on a SQLite compiler options DB."""
+
+    def __init__(self, sqlite_file: str = SQLITE_FILE):
+        # as_uri() percent-encodes "?", "#" and "%" in the path
+        uri = pathlib.Path(sqlite_file).resolve().as_uri() + "?mode=ro"
+        self.connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    def __enter__(self) -> "OptionsDB":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def version(self) -> Optional[str]:
+        """Version date of the guide the DB was generated from."""
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return row[0] if row else None
+
+    def _entry(self, option_id: int, opt: str, desc: str, prereq: Optional[str]) -> Dict[str, Any]:
+        """Rebuild an options entry in the JSON format."""
+        entry: Dict[str, Any] = {"opt": opt, "desc": desc}
+        if prereq is not None:
+            entry["prereq"] = prereq
+        entry["requires"] = dict(self.connection.execute(
+            "SELECT tool, version FROM requires WHERE option_id = ? ORDER BY rowid",
+            (option_id,)))
+        return entry
+
+    def lookup(self, opt: str) -> Optional[Dict[str, Any]]:
+        """Return the entry of the given flag, or None if it is not in the DB."""
+        row = self.connection.execute(
+            "SELECT id, opt, desc, prereq FROM options WHERE opt = ?", (opt,)).fetchone()
+        return self._entry(*row) if row else None
+
+    def flags_for(self, tool: str, version: str, category: str = "recommended") -> List[str]:
+        """Flags of the category that the given toolchain version is recorded to support.
+
+        Flags without any version requirement are included, as in `resolver.py`.
+        """
+        rows = self.connection.execute(
+            "SELECT opt FROM options WHERE category = ? AND ("
+            "EXISTS (SELECT 1 FROM requires WHERE option_id = options.id "
+            "AND tool = ? AND version_key <= ?) "
+            "OR NOT EXISTS (SELECT 1 FROM requires WHERE option_id = options.id)) "
+            "ORDER BY id",
+            (category, tool, version_key(version)))
+        return [row[0] for row in rows]
+
+
+def main():
+    """Convert a JSON compiler options DB to SQLite."""
+    parser = argparse.ArgumentParser(description="Convert compiler-options.json to SQLite")
+    parser.add_argument("db_file", help="JSON compiler options DB")
+    parser.add_argument("sqlite_file", nargs="?", default=SQLITE_FILE,
+                        help="output SQLite file (default: %(default)s)")
+    args = parser.parse_args()
+    with open(args.db_file, "r") as fp:
+        write_sqlite(json.load(fp), args.sqlite_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# http_cache.py
+# Description: On-disk HTTP validator cache for the compiler options scraper
+        # Stores the ETag/Last-Modified validators of the last fetched guide together with
+        # the compiler options DB that was produced from it, so that unchanged pages can be
+        # detected with a conditional GET and neither re-parsed nor re-written
+
+import hashlib
+import json
+import os
+from typing import Optional, Dict, Any, Mapping
+
+
+# response headers that are replayed as conditional request headers
+# NOTE: header names are case-insensitive, HTTP/2 proxies and CDNs send them in lowercase
+VALIDATORS = {
+    "etag": "If-None-Match",
+    "last-modified": "If-Modified-Since",
+}
+
+
+class HTTPCache:
+    """Cache of HTTP validators and generated DBs, one entry per URL."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        """Return the cache file path used for the given URL."""
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _load(self, url: str) -> Optional[Dict[str, Any]]:
+        """Load the cache entry for the given URL, if any."""
+        try:
+            with open(self._path(url), "r") as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from the stored validators."""
+        entry = self._load(url)
+        # without a stored DB a 304 response would leave us with nothing to write
+        if not entry or entry.get("db") is None:
+            return {}
+        return {VALIDATORS[name.lower()]: value
+                for name, value in entry.get("validators", {}).items()
+                if name.lower() in VALIDATORS}
+
+    def load_db(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the DB generated from the cached version of the page."""
+        entry = self._load(url)
+        if not entry:
+            return None
+        return entry.get("db")
+
+    def save(self, url: str, headers: Mapping[str, str], db: Dict[str, Any]) -> None:
+        """Store the validators from the response headers and the generated DB."""
+        validators = {name.lower(): value for name, value in headers.items()
+                      if name.lower() in VALIDATORS}
+        entry = {"url": url, "validators": validators, "db": db}
+        # write to a temporary file first so an interrupted run never corrupts the cache
+        path = self._path(url)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as fp:
+            json.dump(entry, fp)
+        os.replace(tmp_path, path)
@@ -6,30 +6,96 @@
         # Scrapes the webpage and stores the options in JSON format in `compiler-options.json` \
         # file in the execution directory
 
+import argparse
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
 import json
+import os
 import re
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Optional, List, Dict, Tuple, Any, Callable, Iterable, Mapping
+
+from async_fetch import AsyncFetcher, RETRIES, TIMEOUT
+from db_sqlite import write_sqlite
+from http_cache import HTTPCache
+from table_locator import CATEGORIES, DEFAULT_CATEGORIES, locate_tables
+from table_stream import stream_tables
+from versions import TOOLCHAINS
 
 
 OPENSSF_URL = ("https://best.openssf.org/Compiler-Hardening-Guides/"
                 "Compiler-Options-Hardening-Guide-for-C-and-C++.html")
 DB_FILE = "compiler-options.json"
+HTTP_NOT_MODIFIED = 304
+# "html.parser" and "lxml" build a BeautifulSoup tree, "stream" only extracts the tables
+PARSER_BACKENDS = ("html.parser", "lxml", "stream")
+DEFAULT_PARSER = "html.parser"
 
+# NOTE: the last version node is assumed to be single digit
+# if you need to support multiple digits, d+ can be added
+# however, it will start including the superscript references in the version number
+# example: -D_FORTIFY_SOURCE=3
+# longest labels first, so that a label that is a prefix of another cannot shadow it
+VERSION_REGEX = re.compile(
+    r'(' + '|'.join(re.escape(label) for label in sorted(TOOLCHAINS, key=len, reverse=True))
+    + r')\s+(\d+\.\d+\.\d)')
 
-def scrape_document(url: str) -> Optional[BeautifulSoup]:
-    """Scrape the document from the given URL."""
-    response = requests.get(url)
+
+def fetch_document(url: str, request: Callable = requests.get) -> Optional[str]:
+    """Fetch the HTML content of the document from the given URL."""
+    try:
+        response = request(url)
+    except requests.RequestException as error:
+        print("Failed to fetch HTML content:", error)
+        return None
     if response.status_code == 200:
-        return BeautifulSoup(response.text, 'html.parser')
+        return response.text
     print("Failed to fetch HTML content")
     return None
 
+
+def scrape_document(url: str, request: Callable = requests.get,
+                    parser: str = DEFAULT_PARSER) -> Optional[BeautifulSoup]:
+    """Scrape the document from the given URL."""
+    html = fetch_document(url, request)
+    if html is None:
+        return None
+    return BeautifulSoup(html, parser)
+
+
+def fetch_if_modified(url: str, cache: HTTPCache, request: Callable = requests.get,
+                      cache_key: Optional[str] = None) \
+        -> Tuple[Optional[str], Optional[Mapping[str, str]]]:
+    """Fetch the document using a conditional GET against the cached validators.
+
+    Returns the HTML content and the case-insensitive response headers. The content is None if the
+    page has not changed since the cached version, both are None if the fetch failed.
+    The cache entry is looked up by cache_key, which defaults to the URL.
+    """
+    try:
+        response = request(url, headers=cache.conditional_headers(cache_key or url))
+    except requests.RequestException as error:
+        print("Failed to fetch HTML content:", error)
+        return None, None
+    if response.status_code == HTTP_NOT_MODIFIED:
+        return None, response.headers
+    if response.status_code == 200:
+        return response.text, response.headers
+    print("Failed to fetch HTML content")
+    return None, None
+
 # Assumes version date is in the first paragraph element
 def extract_version_from_soup(soup: BeautifulSoup) -> Optional[str]:
     """Extract version date from the document's subtitle."""
-    subtitle = soup.find('p').get_text()
+    paragraph = soup.find('p')
+    if paragraph is None:
+        print("No subtitle found in the document")
+        return None
+    return extract_version_from_subtitle(paragraph.get_text())
+
+
+def extract_version_from_subtitle(subtitle: Optional[str]) -> Optional[str]:
+    """Extract version date from the given subtitle text."""
     if not subtitle:
         print("No subtitle found in the document")
         return None
@@ -57,7 +123,8 @@ def table_to_dicts(table: BeautifulSoup) -> List[Dict[str, str]]:
         row_data = []
         for cell in row.find_all('td'):
             for r in cell:
-                if (r.string is None):
+                # e.g. <br/>: keep the words around it apart, children with text are kept
+                if (r.string is None and not r.get_text()):
                     r.string = ' '
             row_data.append(cell.get_text())
         row_dict = dict(zip(headers, row_data))
@@ -94,56 +161,148 @@ def convert_to_json(table_data: List[Dict[str, str]]) -> List[Dict[str, Any]]:
 
 def extract_versions(input_string: str) -> Dict[str, str]:
     """Extract version information of dependencies from the input string."""
-    versions = {}
-    # Regex for various dependencies
-    # NOTE: the last version node is assumed to be single digit
-    # if you need to support multiple digits, d+ can be added
-    # however, it will start including the superscript references in the version number
-    # example: -D_FORTIFY_SOURCE=3
-    version_patterns = {
-        'gcc': r'GCC\s+(\d+\.\d+\.\d)',
-        'clang': r'Clang\s+(\d+\.\d+\.\d)',
-        'binutils': r'Binutils\s+(\d+\.\d+\.\d)',
-        'libc++': r'libc\+\+\s+(\d+\.\d+\.\d)',
-        'libstdc++': r'libstdc\+\+\s+(\d+\.\d+\.\d)'
-    }
-
-    versions = {}
-    for key, pattern in version_patterns.items():
-        match = re.search(pattern, input_string)
-        if match:
-            versions[key] = match.group(1)
-
-    return versions
-
-
-def main():
-    """Main function to scrape and process the document."""
-    soup = scrape_document(OPENSSF_URL)
-    if not soup:
-        print("Error: Unable to scrape document")
-        return
+    # single scan over the input, the first version found for each dependency wins
+    found = {}
+    for match in VERSION_REGEX.finditer(input_string):
+        found.setdefault(TOOLCHAINS[match.group(1)], match.group(2))
+        if len(found) == len(TOOLCHAINS):
+            break
+
+    # keep the key order of TOOLCHAINS in the output
+    return {key: found[key] for key in TOOLCHAINS.values() if key in found}
+
+
+def tables_to_db(version: Optional[str], tables: Dict[str, List[Dict[str, str]]]) \
+        -> Optional[Dict[str, Any]]:
+    """Build the DB from the rows of the options tables of every category."""
+    missing = [category for category, rows in tables.items() if not rows]
+    if missing:
+        print("No options tables found for:", ", ".join(missing))
+        return None
+
+    # convert table to JSON format
+    options = {category: convert_to_json(rows) for category, rows in tables.items()}
+    return {"version": version, "options": options}
 
+
+def soup_to_db(soup: BeautifulSoup, categories: Iterable[str] = DEFAULT_CATEGORIES) \
+        -> Optional[Dict[str, Any]]:
+    """Convert the scraped document to the compiler options DB format."""
     # extract document version info
     version = extract_version_from_soup(soup)
-    # extract all tables from soup: finds all <table> tags
-    tables = soup.find_all('table')
+    # find the options tables by their caption and headers: stops after the last one
+    tables = locate_tables(soup, categories)
 
-    # NOTE: we only care about tables 1 and 2, since those contain recommended options
     # convert tables to list of dictionaries and merge entries
-    recommended_data = table_to_dicts(tables[1]) + table_to_dicts(tables[2])
+    table_data = {category: [row for table in category_tables for row in table_to_dicts(table)]
+                  for category, category_tables in tables.items()}
+    return tables_to_db(version, table_data)
 
-    # convert table to JSON format
-    json_data = convert_to_json(recommended_data)
 
-    output_db = {"version": version, "options": {"recommended": json_data}}
+def stream_to_db(html: str, categories: Iterable[str] = DEFAULT_CATEGORIES) \
+        -> Optional[Dict[str, Any]]:
+    """Convert the HTML document to the DB format without building a document tree."""
+    extractor = stream_tables(html, categories)
+    version = extract_version_from_subtitle(extractor.first_paragraph)
+    return tables_to_db(version, extractor.tables)
+
 
-    with open(DB_FILE, "w") as fp:
+def html_to_db(html: str, parser: str = DEFAULT_PARSER,
+               categories: Iterable[str] = DEFAULT_CATEGORIES) -> Optional[Dict[str, Any]]:
+    """Convert the HTML document to the DB format using the given parser backend."""
+    if parser == "stream":
+        return stream_to_db(html, categories)
+    # only the subtitle paragraph and the tables are needed, skip building the rest
+    only = SoupStrainer(['p', 'table'])
+    return soup_to_db(BeautifulSoup(html, parser, parse_only=only), categories)
+
+
+def parser_available(parser: str) -> bool:
+    """Check whether the parser backend can be used, e.g. "lxml" needs the lxml package."""
+    return parser == "stream" or builder_registry.lookup(parser) is not None
+
+
+def write_db(output_db: Dict[str, Any], db_file: str = DB_FILE) -> None:
+    """Write the compiler options DB to the given file in JSON format."""
+    with open(db_file, "w") as fp:
         # json_formatted_str = json.dumps(output_db, indent=4)
         # fp.write(json_formatted_str)
         json.dump(output_db, fp, indent=4)
-        print("Write compiler options in json to:", DB_FILE)
+        print("Write compiler options in json to:", db_file)
+
+
+def write_outputs(output_db: Dict[str, Any], sqlite_file: Optional[str] = None,
+                  missing_only: bool = False) -> None:
+    """Write DB_FILE and, if requested, the SQLite DB.
+
+    With missing_only, only outputs that do not exist yet are written.
+    """
+    if not (missing_only and os.path.exists(DB_FILE)):
+        write_db(output_db)
+    if sqlite_file and not (missing_only and os.path.exists(sqlite_file)):
+        write_sqlite(output_db, sqlite_file)
+
+
+def main(cache_dir: Optional[str] = None, request: Callable = requests.get,
+         parser: str = DEFAULT_PARSER, sqlite_file: Optional[str] = None,
+         categories: Iterable[str] = DEFAULT_CATEGORIES):
+    """Main function to scrape and process the document.
+
+    If cache_dir is given, the page is only re-parsed and the outputs only rewritten
+    when the server reports that the page has changed since the previous run.
+    """
+    categories = tuple(categories)
+    if cache_dir is None:
+        html = fetch_document(OPENSSF_URL, request)
+        output_db = html_to_db(html, parser, categories) if html is not None else None
+        if output_db is None:
+            print("Error: Unable to scrape document")
+            return
+        write_outputs(output_db, sqlite_file)
+        return
+
+    cache = HTTPCache(cache_dir)
+    # the cached DB is only valid for the same selection of tables
+    cache_key = OPENSSF_URL + "#" + ",".join(categories)
+    html, headers = fetch_if_modified(OPENSSF_URL, cache, request, cache_key)
+    if html is None:
+        cached_db = cache.load_db(cache_key)
+        if headers is None or cached_db is None:
+            print("Error: Unable to scrape document")
+            return
+        print("Document not modified since version", cached_db["version"])
+        # a fresh build image may not have the outputs yet, restore them from the cache
+        write_outputs(cached_db, sqlite_file, missing_only=True)
+        return
+
+    output_db = html_to_db(html, parser, categories)
+    if output_db is None:
+        print("Error: Unable to scrape document")
+        return
+    write_outputs(output_db, sqlite_file)
+    cache.save(cache_key, headers, output_db)
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(
+        description="Scrape recommended compiler options from the OpenSSF guide")
+    parser.add_argument("--cache-dir",
+                        help="directory for the HTTP cache, enables conditional requests")
+    parser.add_argument("--parser", choices=PARSER_BACKENDS, default=DEFAULT_PARSER,
+                        help="HTML parser backend (default: %(default)s)")
+    parser.add_argument("--sqlite", metavar="SQLITE_FILE",
+                        help="also write the options to the given SQLite database")
+    parser.add_argument("--categories", nargs="+", choices=CATEGORIES,
+                        default=list(DEFAULT_CATEGORIES),
+                        help="options tables to extract (default: %(default)s)")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT,
+                        help="seconds per request, including the download (default: %(default)s)")
+    parser.add_argument("--retries", type=int, default=RETRIES,
+                        help="retries of failed requests (default: %(default)s)")
+    args = parser.parse_args()
+    if not parser_available(args.parser):
+        parser.error(f"parser backend {args.parser} is not installed, "
+                     f"try: pip install {args.parser}")
+    with AsyncFetcher(timeout=args.timeout, retries=args.retries) as fetcher:
+        main(cache_dir=args.cache_dir, request=fetcher.request, parser=args.parser,
+             sqlite_file=args.sqlite, categories=args.categories)
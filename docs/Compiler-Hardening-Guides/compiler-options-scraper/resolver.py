@@ -0,0 +1,92 @@
+# resolver.py
+# Description: Toolchain-aware flag resolver on top of the compiler options DB
+        # Returns the flags of the DB that apply to a detected toolchain, based on the
+        # `requires` versions produced by `convert_to_json()`
+        # Results are memoized per toolchain signature, since build farms resolve the same few
+        # toolchain combinations over and over
+        # Only depends on the standard library
+
+import argparse
+import json
+from functools import lru_cache
+from typing import List, Dict, Tuple, Any, Mapping
+
+from versions import TOOLCHAINS, Version, parse_version
+
+
+CATEGORY = "recommended"
+CACHE_SIZE = 128
+
+# e.g. (("binutils", (2, 38, 0)), ("gcc", (12, 2, 0)))
+Signature = Tuple[Tuple[str, Version], ...]
+
+
+def toolchain_signature(toolchain: Mapping[str, str]) -> Signature:
+    """Normalize a toolchain to a hashable signature, e.g. "12.2" and "12.2.0" are equal."""
+    return tuple(sorted((tool, parse_version(version))
+                        for tool, version in toolchain.items() if version))
+
+
+class Resolver:
+    """Resolve the applicable flags of a compiler options DB for a toolchain.
+
+    An entry applies if at least one tool of its `requires` is part of the toolchain and every
+    such tool is at least the required version. Tools missing from the toolchain are ignored,
+    e.g. a flag supported since "GCC 8.0.0, Clang 7.0.0" applies to GCC 12 without clang.
+    Entries without any version requirement always apply, even if they are specific to another
+    compiler or runtime, e.g. -D_LIBCPP_HARDENING_MODE for GCC with libstdc++.
+    """
+
+    def __init__(self, db: Dict[str, Any], category: str = CATEGORY, cache_size: int = CACHE_SIZE):
+        self.version = db.get("version")
+        # parse every version once, resolving only compares tuples
+        self.entries: List[Tuple[str, Dict[str, Version]]] = [
+            (entry["opt"], {tool: parse_version(version)
+                            for tool, version in entry["requires"].items()})
+            for entry in db["options"].get(category, [])
+        ]
+        self._resolve = lru_cache(maxsize=cache_size)(self._resolve_signature)
+
+    @classmethod
+    def load(cls, db_file: str, category: str = CATEGORY) -> "Resolver":
+        """Create a resolver from a JSON DB file."""
+        with open(db_file, "r") as fp:
+            return cls(json.load(fp), category)
+
+    def _resolve_signature(self, signature: Signature) -> Tuple[str, ...]:
+        toolchain = dict(signature)
+        flags = []
+        for opt, requires in self.entries:
+            present = [tool for tool in requires if tool in toolchain]
+            if requires and not present:
+                continue
+            if all(toolchain[tool] >= requires[tool] for tool in present):
+                flags.append(opt)
+        return tuple(flags)
+
+    def resolve(self, toolchain: Mapping[str, str]) -> Tuple[str, ...]:
+        """Return the flags that apply to the toolchain, e.g. {"gcc": "12.2", "binutils": "2.38"}."""
+        return self._resolve(toolchain_signature(toolchain))
+
+    def cache_info(self):
+        """Hit and miss statistics of the per-toolchain cache."""
+        return self._resolve.cache_info()
+
+
+def main():
+    """Print the flags applicable to the toolchain given on the command line."""
+    parser = argparse.ArgumentParser(description="Resolve the recommended flags for a toolchain")
+    parser.add_argument("--db", default="compiler-options.json",
+                        help="JSON compiler options DB (default: %(default)s)")
+    for tool in TOOLCHAINS.values():
+        parser.add_argument(f"--{tool}", metavar="VERSION", help=f"{tool} version")
+    args = vars(parser.parse_args())
+    db_file = args.pop("db")
+    toolchain = {tool: version for tool, version in args.items() if version}
+    if not toolchain:
+        parser.error("at least one toolchain version is required")
+    print(" ".join(opt.strip() for opt in Resolver.load(db_file).resolve(toolchain)))
+
+
+if __name__ == "__main__":
+    main()
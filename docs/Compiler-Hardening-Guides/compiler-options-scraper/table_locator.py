@@ -0,0 +1,99 @@
+# table_locator.py
+# Description: Header-driven discovery of the options tables in the guide HTML page
+        # An options table is recognized by its caption paragraph ("Table 1: Recommended
+        # compiler options ...") and its header signature ("Compiler Flag", "Supported since")
+        # instead of its position in the document
+        # Tables of one category follow each other, so the walk stops once the tables of every
+        # requested category have been found
+
+import re
+from typing import Optional, List, Dict, Iterable, Sequence
+
+from bs4 import BeautifulSoup, Tag
+
+
+CATEGORIES = ("recommended", "discouraged")
+DEFAULT_CATEGORIES = ("recommended",)
+HEADER_SIGNATURE = ("Compiler Flag", "Supported since")
+CAPTION_REGEX = re.compile(r'^\s*Table\s+\d+:(.*)', re.S)
+
+
+def caption_category(caption: Optional[str]) -> Optional[str]:
+    """Return the category named in a table caption such as "Table 3: List of discouraged ..."."""
+    if not caption:
+        return None
+    match = CAPTION_REGEX.match(caption)
+    if not match:
+        return None
+    words = match.group(1).lower()
+    for category in CATEGORIES:
+        if category in words:
+            return category
+    return None
+
+
+def has_signature(headers: Sequence[str]) -> bool:
+    """Check that the table headers contain every column of HEADER_SIGNATURE."""
+    headers = [header.strip() for header in headers]
+    return all(column in headers for column in HEADER_SIGNATURE)
+
+
+class TableLocator:
+    """Track which tables belong to the requested categories and when to stop looking."""
+
+    def __init__(self, categories: Iterable[str] = DEFAULT_CATEGORIES):
+        self.categories = tuple(categories)
+        unknown = set(self.categories) - set(CATEGORIES)
+        if unknown:
+            raise ValueError(f"Unknown table categories: {sorted(unknown)}")
+        self.found: Dict[str, int] = {category: 0 for category in self.categories}
+        self._current: Optional[str] = None
+
+    def wants(self, caption: Optional[str]) -> Optional[str]:
+        """Return the requested category of the table following the caption, if any.
+
+        Must be called for every table in document order.
+        """
+        category = caption_category(caption)
+        if category not in self.found:
+            category = None
+        self._current = category
+        return category
+
+    def accept(self, category: str) -> None:
+        """Record a table of the category whose headers matched HEADER_SIGNATURE."""
+        self.found[category] += 1
+
+    @property
+    def done(self) -> bool:
+        """True once every category was found and the last run of tables has ended."""
+        return self._current is None and all(self.found.values())
+
+    def missing(self) -> List[str]:
+        """Requested categories for which no table was found."""
+        return [category for category, count in self.found.items() if not count]
+
+
+def table_caption(table: Tag) -> Optional[str]:
+    """Text of the paragraph directly preceding the table, if any."""
+    previous = table.find_previous_sibling()
+    if previous is None or previous.name != 'p':
+        return None
+    return previous.get_text()
+
+
+def locate_tables(soup: BeautifulSoup, categories: Iterable[str] = DEFAULT_CATEGORIES) \
+        -> Dict[str, List[Tag]]:
+    """Find the options tables of the requested categories, in document order."""
+    locator = TableLocator(categories)
+    tables: Dict[str, List[Tag]] = {category: [] for category in locator.categories}
+    table = soup.find('table')
+    while table is not None:
+        category = locator.wants(table_caption(table))
+        if category and has_signature([th.get_text() for th in table.find_all('th')]):
+            locator.accept(category)
+            tables[category].append(table)
+        if locator.done:
+            break
+        table = table.find_next('table')
+    return tables
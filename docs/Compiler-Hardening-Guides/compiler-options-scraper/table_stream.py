@@ -0,0 +1,204 @@
+# table_stream.py
+# Description: Event-driven extraction of <table> elements from the guide HTML page
+        # Uses the standard library HTMLParser callbacks instead of building a full document
+        # tree and only keeps the cells of the options tables that are asked for
+        # The produced rows are identical to those of `table_to_dicts()` in main.py
+        # NOTE: nested tables are not supported, the guide does not use them
+
+from html.parser import HTMLParser
+from typing import Optional, List, Dict, Iterable, Union
+
+from table_locator import DEFAULT_CATEGORIES, TableLocator, has_signature
+
+
+# elements that never have content or an end tag
+VOID_ELEMENTS = frozenset(("area", "base", "br", "col", "embed", "hr", "img", "input",
+                           "link", "meta", "param", "source", "track", "wbr"))
+# size of the chunks fed to the parser, extraction stops after the last requested table
+CHUNK_SIZE = 64 * 1024
+
+
+class _Comment(str):
+    """Comment node: has a string but does not contribute to the text."""
+
+
+class _Element:
+    """Minimal element node holding only what is needed to compute the cell text."""
+
+    __slots__ = ("name", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.children: List[Union[str, "_Element"]] = []
+
+    def string(self) -> Optional[str]:
+        """Mirror BeautifulSoup's `Tag.string`: the single descendant string or None."""
+        if len(self.children) != 1:
+            return None
+        child = self.children[0]
+        if isinstance(child, str):
+            return child
+        return child.string()
+
+    def text(self) -> str:
+        """Mirror BeautifulSoup's `Tag.get_text()`."""
+        return "".join(child.text() if isinstance(child, _Element) else child
+                       for child in self.children if not isinstance(child, _Comment))
+
+
+def _cell_text(cell: _Element) -> str:
+    """Cell text after replacing empty children without a single string by a space.
+
+    This is what `table_to_dicts()` does by assigning ' ' to `r.string`, e.g. for <br/>.
+    """
+    parts = []
+    for child in cell.children:
+        if isinstance(child, _Element):
+            parts.append(child.text() if child.string() is not None or child.text() else " ")
+        elif not isinstance(child, _Comment):
+            parts.append(child)
+    return "".join(parts)
+
+
+class TableExtractor(HTMLParser):
+    """Collect the rows of the options tables of the requested categories.
+
+    Tables are located by their caption paragraph and header signature, see table_locator.py.
+    The text of the first paragraph is kept for the version date.
+    """
+
+    def __init__(self, categories: Iterable[str] = DEFAULT_CATEGORIES):
+        super().__init__(convert_charrefs=True)
+        self.locator = TableLocator(categories)
+        self.tables: Dict[str, List[Dict[str, str]]] = {
+            category: [] for category in self.locator.categories}
+        self.first_paragraph: Optional[str] = None
+        # text of the paragraph directly preceding the next table, i.e. its caption
+        self._caption: Optional[str] = None
+        self._paragraph: Optional[_Element] = None
+        self._category: Optional[str] = None
+        self._table_depth = 0
+        self._headers: List[str] = []
+        self._rows: List[List[str]] = []
+        self._stack: List[_Element] = []
+        self._cell: Optional[_Element] = None
+        self._closed_void: List[str] = []
+
+    @property
+    def done(self) -> bool:
+        """True once the tables of every requested category have been read completely."""
+        return self._table_depth == 0 and self.locator.done
+
+    def _collecting(self) -> bool:
+        return self._table_depth > 0 and self._category is not None
+
+    def handle_starttag(self, tag, attrs, close_void=True):
+        closed = tag in VOID_ELEMENTS and close_void
+        if closed:
+            self._closed_void.append(tag)
+        if self._stack and tag not in ("tr", "td", "th", "table"):
+            # nested element inside a paragraph or a collected cell
+            element = _Element(tag)
+            self._stack[-1].children.append(element)
+            if not closed:
+                self._stack.append(element)
+            return
+        if tag == "table":
+            if self._table_depth == 0:
+                self._category = self.locator.wants(self._caption)
+                self._headers, self._rows = [], []
+            self._table_depth += 1
+        elif self._table_depth == 0:
+            self._caption = None
+            if tag == "p":
+                self._paragraph = _Element(tag)
+                self._stack = [self._paragraph]
+        elif not self._collecting():
+            return
+        elif tag == "tr":
+            self._rows.append([])
+        elif tag in ("td", "th"):
+            self._cell = _Element(tag)
+            self._stack = [self._cell]
+
+    def handle_startendtag(self, tag, attrs):
+        # same bookkeeping as BeautifulSoup's html.parser tree builder: a self-closing tag
+        # following an already closed void tag of the same name is left open
+        self.handle_starttag(tag, attrs, close_void=False)
+        self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in self._closed_void:
+            self._closed_void.remove(tag)
+            return
+        if self._paragraph is not None:
+            if tag == "p":
+                self._caption = self._paragraph.text()
+                if self.first_paragraph is None:
+                    self.first_paragraph = self._caption
+                self._paragraph = None
+                self._stack = []
+            else:
+                self._pop_to(tag)
+            return
+        if tag == "table" and self._table_depth:
+            if self._collecting() and self._table_depth == 1 and has_signature(self._headers):
+                self.locator.accept(self._category)
+                self.tables[self._category] += self._rows_to_dicts()
+            self._table_depth -= 1
+            self._caption = None
+            return
+        if self._table_depth == 0:
+            self._caption = None
+            return
+        if not self._collecting():
+            return
+        if tag in ("td", "th") and self._cell is not None:
+            if tag == "th":
+                self._headers.append(self._cell.text())
+            elif self._rows:
+                self._rows[-1].append(_cell_text(self._cell))
+            self._cell = None
+            self._stack = []
+        else:
+            self._pop_to(tag)
+
+    def _pop_to(self, tag: str) -> None:
+        """Close the most recently opened element with the given name and its children."""
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].name == tag:
+                del self._stack[index:]
+                return
+
+    def handle_data(self, data):
+        if not self._stack:
+            if self._table_depth == 0 and data.strip():
+                # text between the caption and the table
+                self._caption = None
+            return
+        children = self._stack[-1].children
+        # adjacent text is a single string in the BeautifulSoup tree
+        if children and type(children[-1]) is str:
+            children[-1] += data
+        else:
+            children.append(data)
+
+    def handle_comment(self, data):
+        if self._stack:
+            self._stack[-1].children.append(_Comment(data))
+
+    def _rows_to_dicts(self) -> List[Dict[str, str]]:
+        # skip the header row, as `table_to_dicts()` does
+        return [dict(zip(self._headers, row)) for row in self._rows[1:]]
+
+
+def stream_tables(html: str, categories: Iterable[str] = DEFAULT_CATEGORIES) -> TableExtractor:
+    """Feed the HTML page to a TableExtractor, stopping once the wanted tables are read."""
+    extractor = TableExtractor(categories)
+    for start in range(0, len(html), CHUNK_SIZE):
+        extractor.feed(html[start:start + CHUNK_SIZE])
+        if extractor.done:
+            break
+    else:
+        extractor.close()
+    return extractor
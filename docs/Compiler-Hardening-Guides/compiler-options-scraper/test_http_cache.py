@@ -0,0 +1,56 @@
+# test_http_cache.py
+# Description: Tests for the conditional GET of the incremental mode
+        # Run with `python3 -m unittest test_http_cache` from this directory
+
+import tempfile
+import unittest
+
+from requests.structures import CaseInsensitiveDict
+
+from http_cache import HTTPCache
+from main import fetch_if_modified
+
+
+URL = "https://example.org/guide.html"
+
+
+class FakeResponse:
+    """Response with the lowercase header names sent by HTTP/2 proxies and CDNs."""
+
+    def __init__(self, status_code: int, text: str = ""):
+        self.status_code = status_code
+        self.text = text
+        self.headers = CaseInsensitiveDict({"etag": '"abc"',
+                                            "last-modified": "Tue, 30 Jun 2026 00:00:00 GMT"})
+
+
+class LowercaseHeadersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = HTTPCache(tempfile.mkdtemp())
+        self.sent_headers = []
+
+    def request(self, status_code: int):
+        def request(url, headers):
+            self.sent_headers.append(headers)
+            return FakeResponse(status_code, "<p>2026-06-30</p>")
+        return request
+
+    def test_validators_are_stored_and_replayed(self):
+        html, headers = fetch_if_modified(URL, self.cache, self.request(200))
+        self.assertIsNotNone(html)
+        self.cache.save(URL, headers, {"options": {}})
+
+        html, _ = fetch_if_modified(URL, self.cache, self.request(304))
+        self.assertIsNone(html)
+        self.assertEqual(self.sent_headers[-1],
+                         {"If-None-Match": '"abc"',
+                          "If-Modified-Since": "Tue, 30 Jun 2026 00:00:00 GMT"})
+
+    def test_plain_dict_headers(self):
+        self.cache.save(URL, {"ETag": '"abc"'}, {"options": {}})
+        self.assertEqual(self.cache.conditional_headers(URL), {"If-None-Match": '"abc"'})
+
+
+if __name__ == "__main__":
+    unittest.main()
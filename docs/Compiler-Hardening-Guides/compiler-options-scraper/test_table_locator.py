@@ -0,0 +1,32 @@
+# test_table_locator.py
+# Description: Tests for the options tables extracted from the saved guide page
+        # Run with `python3 -m unittest test_table_locator` from this directory
+
+import unittest
+
+from corpus import load_fixture
+from main import PARSER_BACKENDS, html_to_db, parser_available
+from table_locator import CATEGORIES
+
+
+class OptionNamesTest(unittest.TestCase):
+
+    def test_every_option_has_a_name(self):
+        html = load_fixture()
+        for parser in filter(parser_available, PARSER_BACKENDS):
+            with self.subTest(parser=parser):
+                db = html_to_db(html, parser, CATEGORIES)
+                for category in CATEGORIES:
+                    self.assertTrue(db["options"][category])
+                    for entry in db["options"][category]:
+                        self.assertTrue(entry["opt"].strip(), entry)
+
+    def test_option_name_with_nested_markup(self):
+        # <a><code>-Wl,-rpath,</code><em><code>path_to_so</code></em></a>
+        db = html_to_db(load_fixture(), categories=("discouraged",))
+        self.assertEqual([entry["opt"] for entry in db["options"]["discouraged"]],
+                         ["-Wl,-rpath,path_to_so"])
+
+
+if __name__ == "__main__":
+    unittest.main()
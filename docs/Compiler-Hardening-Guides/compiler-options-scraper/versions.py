@@ -0,0 +1,42 @@
+# versions.py
+# Description: Helpers to compare the toolchain versions found in the compiler options DB
+        # Versions are compared as integer tuples, e.g. "12.2" -> (12, 2, 0), never as strings
+        # Only depends on the standard library, so that build wrappers can use it without the
+        # scraper dependencies
+
+import re
+from typing import Tuple
+
+
+# Dependencies listed in the "Supported since" column: label in the guide -> key in the DB
+# Adding a toolchain only requires a new entry here, see extract_versions() in main.py
+TOOLCHAINS = {
+    'GCC': 'gcc',
+    'Clang': 'clang',
+    'Binutils': 'binutils',
+    'libc++': 'libc++',
+    'libstdc++': 'libstdc++',
+}
+
+VERSION_PARTS = 3
+# upper bound for minor and patch numbers when packing a version into a single integer
+PART_LIMIT = 1000
+
+Version = Tuple[int, ...]
+
+
+def parse_version(version: str) -> Version:
+    """Parse a dotted version string into a tuple of VERSION_PARTS integers."""
+    parts = re.findall(r'\d+', version)
+    if not parts:
+        raise ValueError(f"Invalid version: {version!r}")
+    numbers = [int(part) for part in parts[:VERSION_PARTS]]
+    return tuple(numbers + [0] * (VERSION_PARTS - len(numbers)))
+
+
+def version_key(version: str) -> int:
+    """Pack a version into an integer that sorts like the version tuple."""
+    key = 0
+    for part in parse_version(version):
+        key = key * PART_LIMIT + min(part, PART_LIMIT - 1)
+    return key
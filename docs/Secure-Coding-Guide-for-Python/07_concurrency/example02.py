@@ -0,0 +1,259 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Code Example """
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# The workloads are condensed stand-ins modeled on the rule examples, they do not import or run
+# the example files of the rules.
+OPERATIONS = 200_000
+# free-threaded builds carry a "t" suffix
+INTERPRETERS = ("python3.13t", "python3.14t", "python3t")
+
+
+def run_threads(threads: int, target):
+    workers = [threading.Thread(target=target) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def read_amount() -> int:
+    """ A call gives the GIL a chance to switch threads, as in pyscg-0027/example01.py """
+    return 1
+
+
+def number_unlocked(threads: int) -> int:
+    """ Number of pyscg-0027/noncompliant01.py, returns the lost updates """
+    number = {"value": 0}
+    repeats = OPERATIONS // threads
+
+    def add():
+        for _ in range(repeats):
+            number["value"] += read_amount()
+
+    run_threads(threads, add)
+    return repeats * threads - number["value"]
+
+
+def number_locked(threads: int) -> int:
+    """ Number of pyscg-0027/compliant01.py """
+    number = {"value": 0}
+    lock = threading.Lock()
+    repeats = OPERATIONS // threads
+
+    def add():
+        for _ in range(repeats):
+            with lock:
+                number["value"] += read_amount()
+
+    run_threads(threads, add)
+    return repeats * threads - number["value"]
+
+
+def number_sharded(threads: int) -> int:
+    """ Number of pyscg-0027/compliant04.py """
+    shards = []
+    lock = threading.Lock()
+    repeats = OPERATIONS // threads
+
+    def add():
+        shard = [0]
+        with lock:
+            shards.append(shard)
+        for _ in range(repeats):
+            shard[0] += read_amount()
+
+    run_threads(threads, add)
+    return repeats * threads - sum(shard[0] for shard in shards)
+
+
+def chain_animal(threads: int, lock) -> int:
+    """ Writers chain set_name/set_sound while a reader checks that name and sound match """
+    state = {"name": "", "sound": ""}
+    sounds = {"": "", "DOG": "WOOF", "CAT": "MEOW"}
+    inconsistent = [0]
+    writing = threading.Event()
+    writing.set()
+    # every step switches threads, so fewer steps than in the other workloads
+    repeats = OPERATIONS // threads // 40
+
+    def chain(name: str):
+        for _ in range(repeats):
+            with lock:
+                state["name"] = name
+                # the sleeps of set_name() and set_sound(), shortened to a thread switch
+                time.sleep(0)
+                state["sound"] = sounds[name]
+
+    def check():
+        while writing.is_set():
+            with lock:
+                name, sound = state["name"], state["sound"]
+            if sounds[name] != sound:
+                inconsistent[0] += 1
+            # a busy reader would hold on to the GIL for a whole switch interval
+            time.sleep(0)
+
+    reader = threading.Thread(target=check)
+    reader.start()
+    writers = [threading.Thread(target=chain, args=["DOG" if i % 2 else "CAT"])
+               for i in range(threads)]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+    writing.clear()
+    reader.join()
+    return inconsistent[0]
+
+
+def animal_unlocked(threads: int) -> int:
+    """ Animal of pyscg-0027/noncompliant02.py without the sleeps, returns inconsistent reads """
+    return chain_animal(threads, contextlib.nullcontext())
+
+
+def animal(threads: int) -> int:
+    """ Animal of pyscg-0027/compliant02.py without the sleeps, returns inconsistent reads """
+    return chain_animal(threads, threading.Lock())
+
+
+def run_sessions(threads: int, reset: bool) -> int:
+    """ Alternates admin and guest tasks on the same pool threads """
+    user = threading.local()
+    leaked = [0]
+
+    def work_as_admin():
+        try:
+            user.value = "ADMIN"
+        finally:
+            if reset:
+                user.value = "GUEST"
+
+    def work_as_guest():
+        # a pool thread keeps its thread local values between tasks
+        if getattr(user, "value", "GUEST") != "GUEST":
+            leaked[0] += 1
+
+    tasks = OPERATIONS // 10
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        # every thread runs an admin task before the guest tasks start
+        wait([executor.submit(work_as_admin) for _ in range(threads * 4)])
+        wait([executor.submit(work_as_admin if i % 2 else work_as_guest) for i in range(tasks)])
+    return leaked[0]
+
+
+def session_no_reset(threads: int) -> int:
+    """ SessionPool of pyscg-0029/noncompliant01.py, returns guest tasks that ran as admin """
+    return run_sessions(threads, reset=False)
+
+
+def session_pool(threads: int) -> int:
+    """ SessionPool of pyscg-0029/compliant01.py, returns guest tasks that ran as admin """
+    return run_sessions(threads, reset=True)
+
+
+def banking_service(threads: int) -> int:
+    """ Fork/join fan-out of pyscg-0026/compliant06.py, returns the unchecked cards """
+    lock = threading.Lock()
+    counters = {"active": 0, "count": 0}
+    n = round((OPERATIONS // 4) ** (1 / 3))
+    executor = ThreadPoolExecutor(max_workers=threads)
+
+    def run(method):
+        try:
+            method()
+        finally:
+            with lock:
+                counters["active"] -= 1
+
+    def invoke_all(method):
+        futures = []
+        for _ in range(n):
+            with lock:
+                reserved = counters["active"] < threads
+                counters["active"] += reserved
+            if reserved:
+                futures.append(executor.submit(run, method))
+            else:
+                method()
+        wait(futures)
+
+    def check_card_validity():
+        with lock:
+            counters["count"] += 1
+
+    invoke_all(lambda: invoke_all(lambda: invoke_all(check_card_validity)))
+    executor.shutdown()
+    return n ** 3 - counters["count"]
+
+
+def report_table(threads: int) -> int:
+    """ Chunked ReportTableGenerator of pyscg-0026/compliant05.py, returns misplaced rows """
+    inputs = [str(msg) for msg in range(OPERATIONS)]
+    chunk_size = -(-len(inputs) // (threads * 4))
+    chunks = [inputs[start:start + chunk_size] for start in range(0, len(inputs), chunk_size)]
+
+    def create_table_rows(chunk: list) -> list:
+        return [f"|{row.capitalize()}|{len(row)}|" for row in chunk]
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        rows = [row for rows in executor.map(create_table_rows, chunks) for row in rows]
+    return sum(row != f"|{expected}|{len(expected)}|" for row, expected in zip(rows, inputs))
+
+
+WORKLOADS = (number_unlocked, number_locked, number_sharded, animal_unlocked, animal,
+             session_no_reset, session_pool, banking_service, report_table)
+
+
+def measure(max_threads: int):
+    """ Runs every workload with 1 to max_threads threads and prints JSON lines """
+    gil = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    thread_counts = sorted({1, max_threads} | {2 ** i for i in range(max_threads.bit_length())})
+    for workload in WORKLOADS:
+        for threads in thread_counts:
+            start = time.perf_counter()
+            anomalies = workload(threads)
+            seconds = time.perf_counter() - start
+            print(json.dumps({"gil": gil, "workload": workload.__name__, "threads": threads,
+                              "seconds": seconds, "anomalies": anomalies}), flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Thread scaling of the concurrency examples")
+    parser.add_argument("--threads", type=int, default=min(os.cpu_count() or 1, 16),
+                        help="highest number of threads (default: %(default)s)")
+    parser.add_argument("--measure", action="store_true",
+                        help="measure in this interpreter instead of starting the interpreters")
+    args = parser.parse_args()
+    if args.measure:
+        measure(args.threads)
+        return
+
+    interpreters = [sys.executable] + [path for path in map(shutil.which, INTERPRETERS) if path]
+    print(f"{'interpreter':<22} {'GIL':<4} {'workload':<16} {'threads':>7} {'seconds':>8} "
+          f"{'scaling':>7} {'anomalies':>9}")
+    for interpreter in dict.fromkeys(interpreters):
+        output = subprocess.run([interpreter, __file__, "--measure", "--threads", str(args.threads)],
+                                capture_output=True, text=True, check=True).stdout
+        baseline = {}
+        for line in output.splitlines():
+            result = json.loads(line)
+            baseline.setdefault(result["workload"], result["seconds"])
+            print(f"{os.path.basename(interpreter):<22} {'on' if result['gil'] else 'off':<4} "
+                  f"{result['workload']:<16} {result['threads']:>7} {result['seconds']:>8.3f} "
+                  f"{baseline[result['workload']] / result['seconds']:>6.2f}x "
+                  f"{result['anomalies']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Compliant Code Example """
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+logging.basicConfig(level=logging.INFO)
+
+
+def process_message(message: str):
+    """ Method simulating mediation layer i/o heavy work"""
+    logging.debug("process_message: started message   %s working %is", message, int(message) / 10)
+    for _ in range(int(message)):
+        time.sleep(0.01)
+    logging.debug("process_message: completed message %s", message)
+    return f"processed {message}"
+
+
+class MessageAPI(object):
+    """Class simulating the front end facing API"""
+    # TODO: Prevent the attacker from creating multiple MessageAPI objects
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 20, client_quota: int = 10):
+        # TODO: set or handle timeout and limits as they are provided by the mediation layer
+        self.timeout = 1
+        self.max_workers = max_workers
+        self.client_quota = client_quota
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        # one slot per running or queued message, the queue can never grow beyond max_queue
+        self.slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self.lock = threading.Lock()
+        self.in_flight = Counter()
+        self.stats = Counter()
+
+    def _admit(self, client: str) -> bool:
+        """ Reserve a slot for a message of the client, reject it if none is left """
+        with self.lock:
+            if self.in_flight[client] >= self.client_quota:
+                self.stats["rejected_quota"] += 1
+                return False
+            if not self.slots.acquire(blocking=False):
+                self.stats["rejected_queue_full"] += 1
+                return False
+            self.in_flight[client] += 1
+            self.stats["accepted"] += 1
+            self.stats["queued"] += 1
+            self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"],
+                                                self.stats["queued"])
+            return True
+
+    def _run(self, message: str):
+        with self.lock:
+            self.stats["queued"] -= 1
+        return process_message(message)
+
+    def _release(self, client: str, future):
+        with self.lock:
+            if future.cancelled():
+                # cancelled while still waiting in the queue
+                self.stats["queued"] -= 1
+            self.in_flight[client] -= 1
+        self.slots.release()
+
+    def metrics(self) -> dict:
+        """ Current queue depth and admission counters """
+        with self.lock:
+            return {"queue_depth": self.stats["queued"],
+                    "max_queue_depth": self.stats["max_queue_depth"],
+                    "accepted": self.stats["accepted"],
+                    "rejected_queue_full": self.stats["rejected_queue_full"],
+                    "rejected_quota": self.stats["rejected_quota"]}
+
+    def add_messages(self, client: str, messages: list) -> list:
+        """ Receives a list of messages to work on """
+        # TODO: input sanitation.
+        futures = []
+        rejected = 0
+        for message in messages:
+            if not self._admit(client):
+                # shed load right away instead of piling up futures
+                rejected += 1
+                continue
+            future = self.executor.submit(self._run, message)
+            future.add_done_callback(lambda f, c=client: self._release(c, f))
+            futures.append(future)
+        if rejected:
+            logging.warning("add_messages: rejected %i messages from %s", rejected, client)
+        messages_done, messages_not_done = wait(futures, timeout=self.timeout)
+        for future in messages_not_done:
+            future.cancel()
+
+        logging.info("add_messages: client=%s messages_done=%i messages_not_done=%i", client,
+                     len(messages_done), len(messages_not_done))
+        process_messages = []
+        for future in messages_done:
+            process_messages.append(future.result())
+        return process_messages
+
+
+#####################
+# exploiting above code example
+#####################
+mapi = MessageAPI()
+attacker_messages = [str(msg) for msg in range(100)]
+print("ATTACKER: start sending messages from 3 clients")
+# three clients stay within their quota, together they fill the queue
+attackers = [threading.Thread(target=mapi.add_messages, args=[f"attacker{i}", attacker_messages])
+             for i in range(3)]
+for attacker in attackers:
+    attacker.start()
+client_messages = ["1", "2", "3"]
+result_list = mapi.add_messages("client", client_messages)
+print(f"CLIENT: sent {len(client_messages)} messages, got {len(result_list)} messages back")
+for attacker in attackers:
+    attacker.join()
+print(f"METRICS: {mapi.metrics()}")
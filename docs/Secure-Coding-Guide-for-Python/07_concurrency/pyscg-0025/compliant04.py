@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Compliant Code Example """
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError
+from concurrent.futures import as_completed
+from typing import Iterator
+
+logging.basicConfig(level=logging.INFO)
+
+
+def process_message(message: str):
+    """ Method simulating mediation layer i/o heavy work"""
+    logging.debug("process_message: started message   %s working %is", message, int(message) / 10)
+    for _ in range(int(message)):
+        time.sleep(0.01)
+    logging.debug("process_message: completed message %s", message)
+    return f"processed {message}"
+
+
+class MessageAPI(object):
+    """Class simulating the front end facing API"""
+    # TODO: Prevent the attacker from creating multiple MessageAPI objects
+
+    def __init__(self):
+        # TODO: set or handle timeout as it is provided by the mediation layer
+        self.timeout = 1
+        self.executor = ThreadPoolExecutor()
+
+    def stream_messages(self, messages: list) -> Iterator[str]:
+        """ Receives a list of messages to work on, yields each result once it is done """
+        # TODO: limit on max messages from the mediation layer.
+        # TODO: input sanitation.
+        futures = [self.executor.submit(process_message, message) for message in messages]
+        messages_done = 0
+        try:
+            for future in as_completed(futures, timeout=self.timeout):
+                messages_done += 1
+                yield future.result()
+        except TimeoutError:
+            logging.warning("stream_messages: deadline of %is reached", self.timeout)
+        finally:
+            # also runs if the caller stops reading early
+            for future in futures:
+                future.cancel()
+            logging.info("stream_messages: messages_done=%i messages_not_done=%i", messages_done,
+                         len(messages) - messages_done)
+
+
+#####################
+# exploiting above code example
+#####################
+mapi = MessageAPI()
+attacker_messages = [str(msg) for msg in range(100)]
+print("ATTACKER: start sending messages")
+start = time.monotonic()
+result_list = []
+for processed in mapi.stream_messages(attacker_messages):
+    if not result_list:
+        print(f"ATTACKER: first message back after {time.monotonic() - start:.3f}s")
+    result_list.append(processed)
+print(
+    f"ATTACKER: done sending {len(attacker_messages)} messages, got {len(result_list)} messages "
+    f"back")
+print(f"ATTACKER: result_list = {result_list}")
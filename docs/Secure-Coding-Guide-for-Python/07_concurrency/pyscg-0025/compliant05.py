@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Compliant Code Example """
+import asyncio
+import logging
+
+logging.basicConfig(level=logging.INFO)
+
+
+async def process_message(message: str):
+    """ Method simulating mediation layer i/o heavy work"""
+    logging.debug("process_message: started message   %s working %is", message, int(message) / 10)
+    for _ in range(int(message)):
+        await asyncio.sleep(0.01)
+    logging.debug("process_message: completed message %s", message)
+    return f"processed {message}"
+
+
+class MessageAPI(object):
+    """Class simulating the front end facing API"""
+    # TODO: Prevent the attacker from creating multiple MessageAPI objects
+
+    def __init__(self, max_concurrency: int = 32):
+        # TODO: set or handle timeout as it is provided by the mediation layer
+        self.timeout = 1
+        self.max_concurrency = max_concurrency
+        self.semaphore = None
+        self.loop = None
+
+    async def _process(self, message: str):
+        async with self.semaphore:
+            return await process_message(message)
+
+    async def add_messages(self, messages: list) -> list:
+        """ Receives a list of messages to work on """
+        # TODO: limit on max messages from the mediation layer.
+        # TODO: input sanitation.
+        if self.loop is not asyncio.get_running_loop():
+            # limits the messages in progress like max_workers of a thread pool, created per
+            # event loop as a semaphore is bound to the loop it was first used in before 3.10
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+            self.loop = asyncio.get_running_loop()
+        tasks = [asyncio.create_task(self._process(message)) for message in messages]
+        logging.debug("add_messages: submitted %i messages, waiting for %is to complete.",
+                      len(messages), self.timeout)
+        try:
+            # asyncio.timeout() requires Python 3.11+
+            async with asyncio.timeout(self.timeout):
+                await asyncio.gather(*tasks)
+        except TimeoutError:
+            # leaving the timeout cancelled gather() and with it every unfinished task
+            pass
+        messages_done = [task for task in tasks if not task.cancelled()]
+        logging.info("add_messages: messages_done=%i messages_not_done=%i", len(messages_done),
+                     len(tasks) - len(messages_done))
+        return [task.result() for task in messages_done]
+
+
+#####################
+# exploiting above code example
+#####################
+mapi = MessageAPI()
+attacker_messages = [str(msg) for msg in range(100)]
+print("ATTACKER: start sending messages")
+result_list = asyncio.run(mapi.add_messages(attacker_messages))
+print(
+    f"ATTACKER: done sending {len(attacker_messages)} messages, got {len(result_list)} messages "
+    f"back")
+print(f"ATTACKER: result_list = {result_list}")
@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Compliant Code Example """
+import logging
+import math
+import statistics
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from threading import Lock
+
+logging.basicConfig(level=logging.INFO)
+
+
+def process_message(message: str):
+    """ Method simulating mediation layer i/o heavy work"""
+    logging.debug("process_message: started message   %s working %is", message, int(message) / 10)
+    for _ in range(int(message)):
+        time.sleep(0.01)
+    logging.debug("process_message: completed message %s", message)
+    return f"processed {message}"
+
+
+class AdaptiveExecutor(object):
+    """Thread pool that sizes itself from the arrival rate, service time and queue wait"""
+
+    def __init__(self, max_workers: int = 32, max_timeout: float = 1, target_wait: float = 0.1,
+                 window: float = 2):
+        # the hard upper limit, self.limit decides how many workers are used
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.max_workers, self.max_timeout = max_workers, max_timeout
+        self.target_wait, self.window = target_wait, window
+        self.limit, self.active, self.peak_limit = 2, 0, 2
+        self.pending, self.arrivals = deque(), deque()
+        self.service_times, self.latencies = deque(maxlen=200), deque(maxlen=200)
+        self.queue_waits = deque(maxlen=20)
+        self.lock = Lock()
+
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        with self.lock:
+            self.pending.append((future, fn, args, time.monotonic()))
+            self.arrivals.append(time.monotonic())
+            self._dispatch()
+        return future
+
+    def wait(self, futures: list) -> tuple:
+        """ Waits for the adaptive timeout and cancels the messages still queued """
+        timeout = self.timeout()
+        done, not_done = wait(futures, timeout=timeout)
+        with self.lock:
+            for future in not_done:
+                if future.cancel():
+                    # censored sample: all we know is that it would have taken longer
+                    self.latencies.append(timeout)
+        return done, not_done
+
+    def _dispatch(self):
+        while self.pending and self.active < self.limit:
+            future, fn, args, queued_at = self.pending.popleft()
+            if future.set_running_or_notify_cancel():
+                self.active += 1
+                self.executor.submit(self._run, future, fn, args, queued_at)
+
+    def _run(self, future: Future, fn, args, queued_at: float):
+        started = time.monotonic()
+        try:
+            future.set_result(fn(*args))
+        except Exception as error:
+            future.set_exception(error)
+        with self.lock:
+            self.active -= 1
+            self.service_times.append(time.monotonic() - started)
+            self.queue_waits.append(started - queued_at)
+            self.latencies.append(time.monotonic() - queued_at)
+            self._resize()
+            self._dispatch()
+
+    def _resize(self):
+        """ Little's law: workers = throughput * service time """
+        while self.arrivals and self.arrivals[0] < time.monotonic() - self.window:
+            self.arrivals.popleft()
+        needed = len(self.arrivals) / self.window
+        if statistics.fmean(self.queue_waits) > self.target_wait:
+            # messages wait too long, also drain the backlog within target_wait
+            needed += self._backlog() / self.target_wait
+        needed *= statistics.fmean(self.service_times)
+        self.limit = min(max(math.ceil(needed), 2), self.max_workers)
+        self.peak_limit = max(self.peak_limit, self.limit)
+
+    def timeout(self) -> float:
+        """ 1.5 times the 95th latency percentile, never more than max_timeout """
+        with self.lock:
+            if len(self.latencies) < 20:
+                return self.max_timeout
+            return min(statistics.quantiles(self.latencies, n=20)[-1] * 1.5, self.max_timeout)
+
+    def _backlog(self) -> int:
+        """ Queued messages, without those cancelled by the timeout """
+        return sum(not future.cancelled() for future, *_ in self.pending)
+
+    def stats(self, reset: bool = False) -> dict:
+        """ Sizing decision and the measurements it is based on """
+        with self.lock:
+            stats = {"limit": self.limit, "peak_limit": self.peak_limit, "active": self.active,
+                     "queued": self._backlog(), "arrival_rate": len(self.arrivals) / self.window,
+                     "queue_wait": round(statistics.fmean(self.queue_waits or [0]), 3)}
+            if reset:
+                self.peak_limit = self.limit
+            return stats
+
+
+class MessageAPI(object):
+    """Class simulating the front end facing API"""
+    # TODO: Prevent the attacker from creating multiple MessageAPI objects
+
+    def __init__(self):
+        self.executor = AdaptiveExecutor()
+
+    def add_messages(self, messages: list) -> list:
+        """ Receives a list of messages to work on """
+        # TODO: limit on max messages from the mediation layer.
+        # TODO: input sanitation.
+        futures = []
+        for message in messages:
+            futures.append(self.executor.submit(process_message, message))
+        messages_done, messages_not_done = self.executor.wait(futures)
+        logging.info("add_messages: messages_done=%i messages_not_done=%i", len(messages_done),
+                     len(messages_not_done))
+        process_messages = []
+        for future in messages_done:
+            process_messages.append(future.result())
+        return process_messages
+
+
+#####################
+# exploiting above code example
+#####################
+mapi = MessageAPI()
+for round_number in range(3):
+    client_messages = [str(msg % 5) for msg in range(50)]
+    result_list = mapi.add_messages(client_messages)
+    print(f"CLIENT: round {round_number}, got {len(result_list)} of {len(client_messages)} back, "
+          f"timeout {mapi.executor.timeout():.2f}s")
+    print(f"STATS: {mapi.executor.stats(reset=True)}")
+    time.sleep(1)
+attacker_messages = [str(msg) for msg in range(100)]
+print("ATTACKER: start sending messages")
+result_list = mapi.add_messages(attacker_messages)
+print(
+    f"ATTACKER: done sending {len(attacker_messages)} messages, got {len(result_list)} messages "
+    f"back")
+print(f"STATS: {mapi.executor.stats()}")
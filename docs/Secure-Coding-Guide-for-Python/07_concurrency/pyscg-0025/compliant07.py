@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Compliant Code Example """
+import logging
+import random
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+logging.basicConfig(level=logging.INFO)
+
+
+class Deadline(object):
+    """Point in time shared by every step of a request"""
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0)
+
+    def expired(self) -> bool:
+        return self.remaining() == 0
+
+
+def process_message(message: str, deadline: Deadline):
+    """ Method simulating mediation layer i/o heavy work"""
+    logging.debug("process_message: started message   %s working %is", message, int(message) / 10)
+    for _ in range(int(message)):
+        if deadline.expired():
+            # nobody is waiting for the result anymore, stop working on it
+            raise TimeoutError(f"message {message} exceeded its deadline")
+        time.sleep(0.01)
+    logging.debug("process_message: completed message %s", message)
+    return f"processed {message}"
+
+
+class MessageAPI(object):
+    """Class simulating the front end facing API"""
+    # TODO: Prevent the attacker from creating multiple MessageAPI objects
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor()
+
+    def add_messages(self, messages: list, deadline: Deadline) -> list:
+        """ Receives a list of messages to work on """
+        # TODO: limit on max messages from the mediation layer.
+        # TODO: input sanitation.
+        futures = []
+        for message in messages:
+            futures.append(self.executor.submit(process_message, message, deadline))
+        # the grace period is half of the remaining budget, not an additional timeout
+        messages_done, messages_not_done = wait(futures, timeout=deadline.remaining() / 2)
+        if len(messages_not_done) > 0:
+            # TODO: be graceful, warn a trusted client
+            logging.warning("add_messages: %i more messages to process, %.2fs left",
+                            len(messages_not_done), deadline.remaining())
+            messages_done, messages_not_done = wait(futures, timeout=deadline.remaining())
+        for future in messages_not_done:
+            future.cancel()
+
+        logging.info("add_messages: messages_done=%i messages_not_done=%i", len(messages_done),
+                     len(messages_not_done))
+        process_messages = []
+        for future in messages_done:
+            if future.exception() is None:
+                process_messages.append(future.result())
+        return process_messages
+
+
+#####################
+# exploiting above code example
+#####################
+mapi = MessageAPI()
+histogram = Counter()
+latencies = []
+for _ in range(10):
+    attacker_messages = [str(random.randrange(25)) for _ in range(random.randrange(1, 6))]
+    start = time.monotonic()
+    result_list = mapi.add_messages(attacker_messages, Deadline(0.2))
+    latencies.append(time.monotonic() - start)
+    histogram[int(latencies[-1] / 0.025)] += 1
+print("ATTACKER: latency histogram of 10 requests with a deadline of 200ms")
+for bucket in range(12):
+    print(f"{bucket * 25:3}ms - {(bucket + 1) * 25:3}ms | {'#' * histogram[bucket]}".rstrip())
+print(f"ATTACKER: max latency {max(latencies) * 1000:.0f}ms")
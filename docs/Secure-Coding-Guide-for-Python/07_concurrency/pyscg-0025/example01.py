@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Code Example """
+import asyncio
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+MESSAGES = 10_000
+WORK = 0.05  # seconds of simulated i/o per message
+
+
+def thread_message(message: str):
+    """ Blocking i/o as in compliant01.py """
+    time.sleep(WORK)
+    return f"processed {message}"
+
+
+async def async_message(message: str):
+    """ Non-blocking i/o as in compliant05.py """
+    await asyncio.sleep(WORK)
+    return f"processed {message}"
+
+
+def run_threads(messages: list, concurrency: int) -> int:
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return len(list(executor.map(thread_message, messages)))
+
+
+async def run_asyncio(messages: list, concurrency: int) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(message: str):
+        async with semaphore:
+            return await async_message(message)
+
+    return len(await asyncio.gather(*(limited(message) for message in messages)))
+
+
+def measure(mode: str, concurrency: int) -> tuple:
+    """ Runs in a fresh process, so that the peak RSS belongs to this run only """
+    messages = [str(msg) for msg in range(MESSAGES)]
+    start = time.perf_counter()
+    try:
+        if mode == "threads":
+            done = run_threads(messages, concurrency)
+        else:
+            done = asyncio.run(run_asyncio(messages, concurrency))
+    except RuntimeError as error:
+        # e.g. "can't start new thread" once the OS thread limit is reached
+        return None, str(error)
+    seconds = time.perf_counter() - start
+    # ru_maxrss is in KiB on Linux
+    return done / seconds, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+if __name__ == "__main__":
+    print(f"{MESSAGES} messages, {WORK}s of i/o each")
+    print(f"{'mode':<8} {'concurrency':>11} {'messages/s':>11} {'peak RSS':>11}")
+    for limit in (100, 1000, 10_000):
+        for name in ("threads", "asyncio"):
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                throughput, rss = pool.submit(measure, name, limit).result()
+            if throughput is None:
+                print(f"{name:<8} {limit:>11} failed: {rss}")
+                continue
+            print(f"{name:<8} {limit:>11} {throughput:>11.0f} {rss / 1024:>8.1f} MiB")
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Compliant Code Example """
+
+import queue
+from concurrent.futures import Future
+from threading import Lock
+from threading import Thread
+from typing import List
+
+
+class HelpingExecutor(object):
+    """Thread pool where a task waiting for a queued task runs it itself"""
+
+    def __init__(self, max_workers: int = 4):
+        self.tasks = queue.SimpleQueue()
+        self.pending = {}
+        self.lock = Lock()
+        self.workers = [Thread(target=self._work, daemon=True) for _ in range(max_workers)]
+        for worker in self.workers:
+            worker.start()
+
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        with self.lock:
+            self.pending[future] = (fn, args)
+        self.tasks.put(future)
+        return future
+
+    def result(self, future: Future):
+        """ Waits for the future, running it in this thread if no worker has started it yet """
+        self._run(future)
+        return future.result()
+
+    def shutdown(self):
+        for _ in self.workers:
+            self.tasks.put(None)
+        for worker in self.workers:
+            worker.join()
+
+    def _work(self):
+        while True:
+            future = self.tasks.get()
+            if future is None:
+                return
+            self._run(future)
+
+    def _run(self, future: Future):
+        with self.lock:
+            # whoever takes the task out of pending runs it, a worker or a waiting task
+            task = self.pending.pop(future, None)
+        if task is None or not future.set_running_or_notify_cancel():
+            return
+        fn, args = task
+        try:
+            future.set_result(fn(*args))
+        except Exception as error:
+            future.set_exception(error)
+
+
+class ReportTableGenerator(object):
+    def __init__(self):
+        self.executor = HelpingExecutor()
+
+    def generate_string_table(self, inputs: List[str]) -> str:
+        futures = []
+        aggregated = "|Data|Length|\n"
+        for i in inputs:
+            futures.append(self.executor.submit(self._create_table_row, i))
+        for future in futures:
+            aggregated += self.executor.result(future)
+        return aggregated
+
+    def _create_table_row(self, row: str) -> str:
+        print(f"Creating a row out of: {row}")
+        future = self.executor.submit(self._reformat_string, row)
+        return f"|{self.executor.result(future)}|{len(row)}|\n"
+
+    def _reformat_string(self, row: str) -> str:
+        print(f"Reformatting {row}")
+        row_reformatted = row.capitalize()
+        return row_reformatted
+
+
+#####################
+# exploiting above code example
+#####################
+report_table_generator = ReportTableGenerator()
+attacker_messages = [str(msg) for msg in range(1000)]
+print("ATTACKER: start sending messages")
+result = report_table_generator.generate_string_table(attacker_messages)
+print(
+    f"ATTACKER: done sending {len(attacker_messages)} messages, got {len(result)} messages "
+    f"back")
+print(f"ATTACKER: result = {result}")
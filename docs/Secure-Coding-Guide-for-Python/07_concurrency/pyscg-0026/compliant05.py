@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Compliant Code Example """
+
+import io
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+
+class ReportTableGenerator(object):
+    def __init__(self, chunk_size: int = 0):
+        self.max_workers = min(32, (os.cpu_count() or 1) + 4)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        # 0 picks a chunk size that gives every worker about four chunks
+        self.chunk_size = chunk_size
+
+    def generate_string_table(self, inputs: List[str]) -> str:
+        chunk_size = self.chunk_size or math.ceil(len(inputs) / (self.max_workers * 4)) or 1
+        chunks = [inputs[start:start + chunk_size]
+                  for start in range(0, len(inputs), chunk_size)]
+        table = io.StringIO()
+        table.write("|Data|Length|\n")
+        # map() returns the chunks in the order of the inputs
+        for rows in self.executor.map(self._create_table_rows, chunks):
+            table.write(rows)
+        return table.getvalue()
+
+    def _create_table_rows(self, chunk: List[str]) -> str:
+        return "".join([self._create_table_row(row) for row in chunk])
+
+    def _create_table_row(self, row: str) -> str:
+        print(f"Creating a row out of: {row}")
+        return f"|{self._reformat_string(row)}|{len(row)}|\n"
+
+    def _reformat_string(self, row: str) -> str:
+        print(f"Reformatting {row}")
+        row_reformatted = row.capitalize()
+        return row_reformatted
+
+
+#####################
+# exploiting above code example
+#####################
+report_table_generator = ReportTableGenerator()
+attacker_messages = [str(msg) for msg in range(1000)]
+print("ATTACKER: start sending messages")
+result = report_table_generator.generate_string_table(attacker_messages)
+print(
+    f"ATTACKER: done sending {len(attacker_messages)} messages, got {len(result)} messages "
+    f"back")
+print(f"ATTACKER: result = {result}")
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Compliant Code Example """
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import Lock
+from typing import Callable
+
+
+class ForkJoinScheduler(object):
+    """Runs subtasks in the pool while a worker is free and in the calling thread otherwise"""
+
+    def __init__(self, max_workers: int = 0):
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self.lock = Lock()
+        # tasks submitted to the pool and not finished yet
+        self.active = 0
+
+    def invoke_all(self, method: Callable, times: int):
+        """ Forks `times` calls of method and joins them """
+        # only the futures of this call are kept, they are dropped once joined
+        futures = []
+        for _ in range(times):
+            if self._reserve_worker():
+                futures.append(self.executor.submit(self._run, method))
+            else:
+                method()
+        wait(futures)
+
+    def _reserve_worker(self) -> bool:
+        with self.lock:
+            # a submitted task always finds an idle worker, so nothing waits in the queue
+            if self.active >= self.max_workers:
+                return False
+            self.active += 1
+            return True
+
+    def _run(self, method: Callable):
+        try:
+            method()
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class BankingService(object):
+    def __init__(self, n: int):
+        self.scheduler = ForkJoinScheduler()
+        self.number_of_times = n
+        self.count = 0
+        self.lock = Lock()
+
+    def for_each_client(self):
+        self.scheduler.invoke_all(self.for_each_account, self.number_of_times)
+
+    def for_each_account(self):
+        self.scheduler.invoke_all(self.for_each_card, self.number_of_times)
+
+    def for_each_card(self):
+        self.scheduler.invoke_all(self.check_card_validity, self.number_of_times)
+
+    def check_card_validity(self):
+        with self.lock:
+            self.count += 1
+
+
+#####################
+# exploiting above code example
+#####################
+browser_manager = BankingService(100)
+start = time.perf_counter()
+browser_manager.for_each_client()
+print(f"Number of checked cards: {browser_manager.count} in "
+      f"{time.perf_counter() - start:.1f}s")
@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Code Example """
+import io
+import tempfile
+import time
+import tracemalloc
+
+
+def concat(rows: list) -> str:
+    """ As in compliant01.py """
+    aggregated = "|Data|Length|\n"
+    for row in rows:
+        aggregated += row
+    return aggregated
+
+
+def concat_shared(rows: list) -> str:
+    """ Same, but a second reference prevents CPython from resizing the string in place """
+    aggregated = "|Data|Length|\n"
+    for row in rows:
+        previous = aggregated
+        aggregated += row
+    del previous
+    return aggregated
+
+
+def join(rows: list) -> str:
+    parts = ["|Data|Length|\n"]
+    for row in rows:
+        parts.append(row)
+    return "".join(parts)
+
+
+def string_io(rows: list) -> str:
+    table = io.StringIO()
+    table.write("|Data|Length|\n")
+    for row in rows:
+        table.write(row)
+    return table.getvalue()
+
+
+def file_sink(rows: list):
+    """ As in compliant04.py with a file as sink """
+    with tempfile.TemporaryFile("w") as table:
+        table.write("|Data|Length|\n")
+        for row in rows:
+            table.write(row)
+
+
+def measure(strategy, rows: list) -> tuple:
+    start = time.perf_counter()
+    strategy(rows)
+    seconds = time.perf_counter() - start
+    # tracing slows down the strategy, so memory is measured in a separate run
+    tracemalloc.start()
+    strategy(rows)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+print(f"{'strategy':<14} {'rows':>9} {'seconds':>9} {'peak MiB':>9}")
+for size in (10**5, 3 * 10**5, 10**6):
+    table_rows = [f"|{str(i).capitalize()}|{len(str(i))}|\n" for i in range(size)]
+    for name, function in (("concat", concat), ("concat_shared", concat_shared), ("join", join),
+                           ("string_io", string_io), ("file_sink", file_sink)):
+        if function is concat_shared and size > 10**5:
+            print(f"{name:<14} {size:>9}   skipped, copies the table per row")
+            continue
+        run_time, peak_bytes = measure(function, table_rows)
+        print(f"{name:<14} {size:>9} {run_time:>9.3f} {peak_bytes / 2**20:>9.1f}")
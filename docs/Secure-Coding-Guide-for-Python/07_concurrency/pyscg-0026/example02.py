@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Code Example """
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+ROWS = 100_000
+WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+def create_table_row(row: str) -> str:
+    return f"|{row.capitalize()}|{len(row)}|\n"
+
+
+def create_table_rows(chunk: list) -> str:
+    return "".join([create_table_row(row) for row in chunk])
+
+
+def split(inputs: list, chunk_size: int) -> list:
+    return [inputs[start:start + chunk_size] for start in range(0, len(inputs), chunk_size)]
+
+
+def per_row(inputs: list) -> str:
+    """ One future per row, as in compliant01.py """
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        futures = [executor.submit(create_table_row, row) for row in inputs]
+        return "".join([future.result() for future in futures])
+
+
+def chunked(inputs: list, chunk_size: int) -> str:
+    """ One future per chunk, as in compliant05.py """
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        return "".join(executor.map(create_table_rows, split(inputs, chunk_size)))
+
+
+def process_pool(inputs: list, chunk_size: int) -> str:
+    """ Chunks sent to worker processes, paying for pickling the rows in both directions """
+    with ProcessPoolExecutor() as executor:
+        return "".join(executor.map(create_table_rows, split(inputs, chunk_size)))
+
+
+if __name__ == "__main__":
+    rows = [str(msg) for msg in range(ROWS)]
+    auto = math.ceil(ROWS / (WORKERS * 4))
+    expected = create_table_rows(rows)
+    strategies = [("sequential", lambda: create_table_rows(rows)),
+                  ("per_row", lambda: per_row(rows))]
+    for size in (10, 100, 1000, auto):
+        strategies.append((f"chunked {size}", lambda size=size: chunked(rows, size)))
+    strategies.append((f"process_pool {auto}", lambda: process_pool(rows, auto)))
+
+    print(f"{ROWS} rows, {WORKERS} workers")
+    for name, strategy in strategies:
+        start = time.perf_counter()
+        table = strategy()
+        seconds = time.perf_counter() - start
+        if table != expected:
+            raise ValueError(f"{name} changed the order of the rows")
+        print(f"{name:<20} {seconds:>8.3f}s")
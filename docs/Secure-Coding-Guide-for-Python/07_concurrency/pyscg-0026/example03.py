@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Code Example """
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from threading import Lock
+from typing import Callable
+
+
+class Profiler(object):
+    """Hook recording how the tasks of each fan-out level were executed"""
+
+    def __init__(self):
+        self.lock = Lock()
+        self.levels = defaultdict(Counter)
+        self.locking = Counter()
+
+    def task(self, level: str, pooled: bool, queue_wait: float = 0.0):
+        with self.lock:
+            stats = self.levels[level]
+            stats["pooled" if pooled else "inline"] += 1
+            stats["queue_wait"] += queue_wait
+
+    @contextmanager
+    def acquire(self, lock: Lock):
+        """ Acquires the lock, recording whether and how long the thread had to wait """
+        waited = 0.0
+        if not lock.acquire(blocking=False):
+            start = time.perf_counter()
+            lock.acquire()
+            waited = time.perf_counter() - start
+        try:
+            yield
+        finally:
+            lock.release()
+            with self.lock:
+                self.locking["acquired"] += 1
+                self.locking["contended"] += waited > 0
+                self.locking["wait"] += waited
+
+
+class ForkJoinScheduler(object):
+    """The scheduler of compliant06.py, reporting every task to the profiler"""
+
+    def __init__(self, max_workers: int, profiler: Profiler):
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.profiler = profiler
+        self.lock = Lock()
+        self.active = 0
+
+    def invoke_all(self, method: Callable, times: int):
+        futures = []
+        for _ in range(times):
+            if self._reserve_worker():
+                futures.append(self.executor.submit(self._run, method, time.perf_counter()))
+            else:
+                self.profiler.task(method.__name__, pooled=False)
+                method()
+        wait(futures)
+
+    def _reserve_worker(self) -> bool:
+        with self.lock:
+            if self.active >= self.max_workers:
+                return False
+            self.active += 1
+            return True
+
+    def _run(self, method: Callable, submitted: float):
+        self.profiler.task(method.__name__, pooled=True,
+                           queue_wait=time.perf_counter() - submitted)
+        try:
+            method()
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class BankingService(object):
+    def __init__(self, n: int, max_workers: int, profiler: Profiler):
+        self.scheduler = ForkJoinScheduler(max_workers, profiler)
+        self.profiler = profiler
+        self.number_of_times = n
+        self.count = 0
+        self.lock = Lock()
+
+    def for_each_client(self):
+        self.scheduler.invoke_all(self.for_each_account, self.number_of_times)
+
+    def for_each_account(self):
+        self.scheduler.invoke_all(self.for_each_card, self.number_of_times)
+
+    def for_each_card(self):
+        self.scheduler.invoke_all(self.check_card_validity, self.number_of_times)
+
+    def check_card_validity(self):
+        with self.profiler.acquire(self.lock):
+            self.count += 1
+
+
+def run(n: int, max_workers: int) -> tuple:
+    profiler = Profiler()
+    service = BankingService(n, max_workers, profiler)
+    start = time.perf_counter()
+    service.for_each_client()
+    seconds = time.perf_counter() - start
+    service.scheduler.executor.shutdown()
+    return seconds, profiler
+
+
+print(f"{'n':>3} {'workers':>7} {'seconds':>8} {'pooled %':>8} {'queue wait':>10} "
+      f"{'contended %':>11}")
+for number_of_times in (5, 10, 20, 40):
+    for workers in (2, 4, 8, 16, 32):
+        run_time, result = run(number_of_times, workers)
+        levels = result.levels.values()
+        pooled = sum(level["pooled"] for level in levels)
+        tasks = pooled + sum(level["inline"] for level in levels)
+        queue_wait = sum(level["queue_wait"] for level in levels) / max(pooled, 1)
+        print(f"{number_of_times:>3} {workers:>7} {run_time:>8.3f} {100 * pooled / tasks:>8.1f} "
+              f"{queue_wait * 1e6:>8.0f}us "
+              f"{100 * result.locking['contended'] / result.locking['acquired']:>11.2f}")
+print("per level for n=10 and 4 workers:")
+for name, counts in run(10, 4)[1].levels.items():
+    print(f"  {name:<20} pooled={counts['pooled']:<5} inline={counts['inline']}")
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Compliant Code Example """
+import logging
+import sys
+import threading
+from threading import Thread
+
+logging.basicConfig(level=logging.INFO)
+
+
+class Number():
+    """
+    Multithreading compatible class taking the lock once per batch of updates.
+    """
+    value = 0
+    repeats = 1000000
+    batch_size = 1000
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
+    def add_batch(self, amounts: list):
+        """Applies a batch of amounts while holding the lock only once"""
+        total = sum(amounts)
+        with self.lock:
+            self.value += total
+        logging.debug("Number.add_batch: applied %i amounts", len(amounts))
+
+    def add(self):
+        """Simulating hard work"""
+        batch = []
+        for _ in range(self.repeats):
+            batch.append(self.read_amount())
+            if len(batch) == self.batch_size:
+                self.add_batch(batch)
+                batch = []
+        self.add_batch(batch)
+
+    def remove(self):
+        """Simulating hard work"""
+        batch = []
+        for _ in range(self.repeats):
+            batch.append(-self.read_amount())
+            if len(batch) == self.batch_size:
+                self.add_batch(batch)
+                batch = []
+        self.add_batch(batch)
+
+    def read_amount(self):
+        """ Simulating reading amount from an external source, i.e. a file, a database, etc. """
+        return 100
+
+
+if __name__ == "__main__":
+    #####################
+    # exploiting above code example
+    #####################
+    number = Number()
+    logging.info("id=%i int=%s size=%s", id(number.value), number.value, sys.getsizeof(number.value))
+    add = Thread(target=number.add)
+    substract = Thread(target=number.remove)
+    add.start()
+    substract.start()
+
+    logging.info('Waiting for threads to finish...')
+    add.join()
+    substract.join()
+
+    logging.info("id=%i int=%s size=%s", id(number.value), number.value, sys.getsizeof(number.value))
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Compliant Code Example """
+import logging
+import threading
+from threading import Thread
+
+logging.basicConfig(level=logging.INFO)
+
+
+class Number():
+    """
+    Multithreading compatible class with one counter shard per thread.
+    """
+    repeats = 1000000
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.shards = []
+
+    def _shard(self) -> list:
+        """Returns the shard of the current thread, registering it on first use"""
+        shard = getattr(self.local, "shard", None)
+        if shard is None:
+            shard = [0]
+            self.local.shard = shard
+            with self.lock:
+                self.shards.append(shard)
+        return shard
+
+    @property
+    def value(self) -> int:
+        """Merges the shards of all threads"""
+        with self.lock:
+            return sum(shard[0] for shard in self.shards)
+
+    def add(self):
+        """Simulating hard work"""
+        # only the current thread ever writes to its shard
+        shard = self._shard()
+        for _ in range(self.repeats):
+            shard[0] += self.read_amount()
+
+    def remove(self):
+        """Simulating hard work"""
+        shard = self._shard()
+        for _ in range(self.repeats):
+            shard[0] -= self.read_amount()
+
+    def read_amount(self):
+        """ Simulating reading amount from an external source, i.e. a file, a database, etc. """
+        return 100
+
+
+if __name__ == "__main__":
+    #####################
+    # exploiting above code example
+    #####################
+    number = Number()
+    logging.info("int=%s", number.value)
+    add = Thread(target=number.add)
+    substract = Thread(target=number.remove)
+    add.start()
+    substract.start()
+
+    logging.info('Waiting for threads to finish...')
+    add.join()
+    substract.join()
+
+    logging.info("int=%s", number.value)
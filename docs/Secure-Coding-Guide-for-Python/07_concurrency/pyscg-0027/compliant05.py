@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+"""Compliant Code Example"""
+
+from dataclasses import dataclass, replace
+from time import sleep
+import logging
+import threading
+import secrets
+
+
+@dataclass(frozen=True)
+class Animal:
+    """Immutable animal, every setter returns a new object"""
+
+    name: str = ""
+    sound: str = ""
+
+    def set_name(self, name: str) -> "Animal":
+        """Returns a copy with the animal's name"""
+        # simulating a long running operation, no other thread can see this copy
+        sleep(0.1)
+        return replace(self, name=name)
+
+    def set_sound(self, sound: str) -> "Animal":
+        """Returns a copy with the sound that the animal makes"""
+        sleep(0.2)
+        return replace(self, sound=sound)
+
+
+class AnimalReference:
+    """Shared reference to the current animal"""
+
+    def __init__(self, animal: Animal):
+        self.animal = animal
+
+    def get(self) -> Animal:
+        """Readers never block, they always get a complete animal"""
+        return self.animal
+
+    def set(self, animal: Animal):
+        """Publishes a new animal, rebinding an attribute is atomic"""
+        self.animal = animal
+
+
+def thread_function(reference: AnimalReference, animal_name: str, animal_sound: str):
+    """Function that changes animal's characteristics using method chaining"""
+    for _ in range(3):
+        animal = reference.get()
+        logging.info(
+            "Thread: starting - %s goes %s",
+            animal.name,
+            animal.sound,
+        )
+        # The new state is built without holding any lock
+        animal = animal.set_name(animal_name).set_sound(animal_sound)
+        reference.set(animal)
+        logging.info(
+            "Thread: finishing - %s goes %s",
+            animal.name,
+            animal.sound,
+        )
+        # Simulate a longer operation on non-shared resources
+        for i in range(10, 1000):
+            _ = (secrets.randbelow(i) + 1) / i
+
+
+#####################
+# Exploiting above code example
+#####################
+
+if __name__ == "__main__":
+    MESSAGE_FORMAT = "%(asctime)s: %(message)s"
+    logging.basicConfig(
+        format=MESSAGE_FORMAT, level=logging.INFO, datefmt="%H:%M:%S"
+    )
+
+    shared_animal = AnimalReference(Animal())
+    dog = threading.Thread(
+        target=thread_function,
+        args=(shared_animal, "DOG", "WOOF"),
+    )
+    cat = threading.Thread(
+        target=thread_function, args=(shared_animal, "CAT", "MEOW")
+    )
+    dog.start()
+    cat.start()
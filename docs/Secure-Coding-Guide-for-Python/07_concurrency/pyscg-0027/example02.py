@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Code Example """
+import sys
+import time
+from threading import Thread
+
+import compliant01
+import compliant03
+import compliant04
+
+REPEATS = 200000
+
+
+def run(number_class, threads: int) -> tuple:
+    """ Half of the threads add, the other half removes, the result must be 0 """
+    number = number_class()
+    number.repeats = REPEATS
+    workers = [Thread(target=number.add if i % 2 == 0 else number.remove)
+               for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start, number.value
+
+
+if __name__ == "__main__":
+    gil = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'design':<14} {'threads':>7} {'updates/s':>12} {'value':>6}")
+    for name, module in (("lock per op", compliant01), ("batched", compliant03),
+                         ("sharded", compliant04)):
+        for thread_count in (2, 4, 8):
+            seconds, value = run(module.Number, thread_count)
+            print(f"{name:<14} {thread_count:>7} {thread_count * REPEATS / seconds:>12.0f} "
+                  f"{value:>6}")
@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Code Example """
+import threading
+import time
+from dataclasses import dataclass, replace
+
+DELAY = 0.01  # compliant02.py sleeps 0.1s in set_name() and 0.2s in set_sound()
+UPDATES = 3
+SOUNDS = {"": "", "DOG": "WOOF", "CAT": "MEOW"}
+
+
+class MutableAnimal:
+    """Animal of compliant02.py"""
+
+    def __init__(self):
+        self.name = ""
+        self.sound = ""
+
+    def set_name(self, name: str):
+        self.name = name
+        time.sleep(DELAY)
+        return self
+
+    def set_sound(self, sound: str):
+        self.sound = sound
+        time.sleep(2 * DELAY)
+        return self
+
+
+@dataclass(frozen=True)
+class Animal:
+    """Animal of compliant05.py"""
+
+    name: str = ""
+    sound: str = ""
+
+    def set_name(self, name: str) -> "Animal":
+        time.sleep(DELAY)
+        return replace(self, name=name)
+
+    def set_sound(self, sound: str) -> "Animal":
+        time.sleep(2 * DELAY)
+        return replace(self, sound=sound)
+
+
+def global_lock(threads: int) -> tuple:
+    lock = threading.Lock()
+    animal = MutableAnimal()
+
+    def update(name: str):
+        for _ in range(UPDATES):
+            with lock:
+                animal.set_name(name).set_sound(SOUNDS[name])
+
+    def read():
+        with lock:
+            return animal.name, animal.sound
+
+    return run(threads, update, read)
+
+
+def copy_on_write(threads: int) -> tuple:
+    reference = {"animal": Animal()}
+
+    def update(name: str):
+        for _ in range(UPDATES):
+            reference["animal"] = reference["animal"].set_name(name).set_sound(SOUNDS[name])
+
+    def read():
+        animal = reference["animal"]
+        return animal.name, animal.sound
+
+    return run(threads, update, read)
+
+
+def run(threads: int, update, read) -> tuple:
+    """ Returns updates per second, slowest read and inconsistent reads """
+    writers = [threading.Thread(target=update, args=["DOG" if i % 2 else "CAT"])
+               for i in range(threads)]
+    start = time.perf_counter()
+    for writer in writers:
+        writer.start()
+    slowest, inconsistent = 0.0, 0
+    while any(writer.is_alive() for writer in writers):
+        read_start = time.perf_counter()
+        name, sound = read()
+        slowest = max(slowest, time.perf_counter() - read_start)
+        inconsistent += SOUNDS[name] != sound
+        time.sleep(DELAY / 10)
+    seconds = time.perf_counter() - start
+    return threads * UPDATES / seconds, slowest, inconsistent
+
+
+if __name__ == "__main__":
+    print(f"{'design':<14} {'threads':>7} {'updates/s':>10} {'slowest read':>13} "
+          f"{'inconsistent':>12}")
+    for name, design in (("global lock", global_lock), ("copy-on-write", copy_on_write)):
+        for thread_count in (2, 4, 8, 16, 32, 64):
+            throughput, slowest_read, inconsistent_reads = design(thread_count)
+            print(f"{name:<14} {thread_count:>7} {throughput:>10.1f} "
+                  f"{slowest_read * 1000:>10.1f} ms {inconsistent_reads:>12}")
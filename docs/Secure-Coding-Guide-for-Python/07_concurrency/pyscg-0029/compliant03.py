@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Compliant Code Example """
+import asyncio
+from time import sleep
+from enum import Enum
+from contextvars import ContextVar, copy_context
+from threading import current_thread
+from concurrent.futures import ThreadPoolExecutor, wait
+
+
+class User(Enum):
+    GUEST = 1
+    ADMIN = 2
+
+
+# Belongs to the context of a task instead of the thread that runs it
+current_user = ContextVar("current_user", default=User.GUEST)
+
+
+class Session(object):
+    def set_user(self, user):
+        current_user.set(user)
+
+    def work_thread(self):
+        """ Perform a task for the user in its own thread """
+        thread = current_thread()
+        print(f"{thread.name}: Working concurrently as {current_user.get()}")
+        sleep(1)  # To allow for worker threads to be reused
+
+    async def work_task(self):
+        """ Perform a task for the user in its own asyncio task """
+        task = asyncio.current_task()
+        print(f"{task.get_name()}: Working concurrently as {current_user.get()}")
+        await asyncio.sleep(1)
+
+
+class SessionPool(object):
+    def __init__(self):
+        self.num_of_threads = 2
+        self.session = Session()
+        # No initializer needed, a worker thread holds no session state
+        self.executor = ThreadPoolExecutor(max_workers=self.num_of_threads)
+
+    def work_as_admin(self):
+        self.session.set_user(User.ADMIN)
+        self.session.work_thread()
+
+    def work_as_guest(self):
+        """Uses the default user (GUEST) to perform a task"""
+        self.session.work_thread()
+
+    async def work_as_admin_async(self):
+        self.session.set_user(User.ADMIN)
+        await self.session.work_task()
+
+    async def work_as_guest_async(self):
+        """Uses the default user (GUEST) to perform a task"""
+        await self.session.work_task()
+
+    def execute_task(self, task):
+        # Each task runs in a copy of the submitting context, its changes are discarded after
+        return self.executor.submit(copy_context().run, task)
+
+
+#####################
+# exploiting above code example
+#####################
+sp = SessionPool()
+futures = [
+    sp.execute_task(sp.work_as_admin),  # works as ADMIN
+    sp.execute_task(sp.work_as_guest),  # should work as GUEST
+    sp.execute_task(sp.work_as_admin),  # works as ADMIN
+    sp.execute_task(sp.work_as_guest),  # should work as GUEST
+    sp.execute_task(sp.work_as_guest),  # should work as GUEST
+    sp.execute_task(sp.work_as_guest),  # should work as GUEST
+]
+# To prevent the main thread from stopping before worker threads finish
+wait(futures)
+for future in futures:
+    future.result()
+
+
+async def main():
+    # asyncio tasks copy the context when they are created
+    await asyncio.gather(
+        asyncio.create_task(sp.work_as_admin_async()),  # works as ADMIN
+        asyncio.create_task(sp.work_as_guest_async()),  # should work as GUEST
+    )
+    await sp.work_as_guest_async()  # should work as GUEST
+
+
+asyncio.run(main())
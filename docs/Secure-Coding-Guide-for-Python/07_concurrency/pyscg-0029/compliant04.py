@@ -0,0 +1,224 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Compliant Code Example """
+import os
+import queue
+from time import sleep
+from enum import Enum
+from collections import Counter
+from threading import local, current_thread, Lock, Thread
+from concurrent.futures import Future, wait
+from concurrent.futures.thread import BrokenThreadPool
+
+
+class User(Enum):
+    GUEST = 1
+    ADMIN = 2
+
+
+def rss() -> int:
+    """ Resident set size of the process in bytes, 0 where /proc is not available """
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return 0
+
+
+class RecyclingExecutor(object):
+    """Thread pool that replaces a worker after max_tasks tasks or max_rss_growth bytes"""
+
+    def __init__(self, max_workers: int, initializer=None, max_tasks: int = 100,
+                 max_rss_growth: int = 64 * 2**20):
+        self.initializer = initializer
+        self.max_tasks = max_tasks
+        # threads share the memory of the process, so the growth of the whole process is used,
+        # None only recycles by the number of tasks
+        self.max_rss_growth = max_rss_growth
+        self.tasks = queue.SimpleQueue()
+        self.lock = Lock()
+        self.stats = Counter()
+        self.workers = set()
+        self.shutting_down = False
+        self.broken = None
+        for _ in range(max_workers):
+            self._start_worker()
+
+    def submit(self, fn, *args) -> Future:
+        with self.lock:
+            if self.broken is not None:
+                raise self.broken
+            if self.shutting_down:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            future = Future()
+            self.tasks.put((future, fn, args))
+        return future
+
+    def shutdown(self, wait: bool = True):
+        """ Runs the queued tasks, then stops the workers """
+        with self.lock:
+            self.shutting_down = True
+            # one sentinel per worker, queued after every task. A retiring worker is replaced
+            # also during shutdown, so its replacement takes the sentinel.
+            for _ in self.workers:
+                self.tasks.put(None)
+        while wait:
+            with self.lock:
+                workers = list(self.workers)
+            if not workers:
+                return
+            # a retiring worker registers its replacement before it exits
+            for worker in workers:
+                worker.join()
+
+    def _start_worker(self):
+        with self.lock:
+            self.stats["workers_started"] += 1
+            worker = Thread(target=self._work, daemon=True,
+                            name=f"RecyclingExecutor_{self.stats['workers_started']}")
+            self.workers.add(worker)
+        worker.start()
+
+    def _work(self):
+        reason = None
+        try:
+            # a fresh thread starts with empty thread-local data
+            if self.initializer is not None:
+                try:
+                    self.initializer()
+                except Exception as error:
+                    # no replacement, it would fail again in the new thread
+                    self._initializer_failed(error)
+                    return
+            reason = "replaced_after_error"
+            start_rss = rss()
+            for _ in range(self.max_tasks):
+                task = self.tasks.get()
+                if task is None:
+                    reason = None
+                    return
+                self._run(*task)
+                if (self.max_rss_growth is not None
+                        and rss() - start_rss > self.max_rss_growth):
+                    reason = "recycled_by_memory"
+                    return
+            reason = "recycled_by_tasks"
+        finally:
+            with self.lock:
+                self.workers.discard(current_thread())
+                if reason is not None:
+                    self.stats[reason] += 1
+            if reason is not None:
+                # keeps the pool at max_workers, also if the worker died
+                self._start_worker()
+
+    def _initializer_failed(self, error: Exception):
+        """ Marks the pool as broken and fails the queued tasks, as ThreadPoolExecutor does """
+        with self.lock:
+            self.broken = BrokenThreadPool("A thread initializer failed, the thread pool is not "
+                                           "usable anymore")
+            self.broken.__cause__ = error
+            sentinels = 0
+            while True:
+                try:
+                    task = self.tasks.get_nowait()
+                except queue.Empty:
+                    break
+                if task is None:
+                    sentinels += 1
+                else:
+                    task[0].set_exception(self.broken)
+            # the other workers still need their sentinels to stop
+            for _ in range(sentinels):
+                self.tasks.put(None)
+
+    @staticmethod
+    def _run(future: Future, fn, args):
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as error:
+            future.set_exception(error)
+            # SystemExit or KeyboardInterrupt end the worker, which is then replaced
+            if not isinstance(error, Exception):
+                raise
+
+
+class Session(object):
+    def __init__(self):
+        self.user = local()
+        self.set_user_as_guest()
+
+    def init_thread(self):
+        self.set_user_as_guest()
+        self.user.cache = []
+
+    def set_user_as_guest(self):
+        self.user.value = User.GUEST
+
+    def set_user(self, user):
+        self.user.value = user
+
+    def work_thread(self):
+        """ Perform a task for the user in its own thread """
+        thread = current_thread()
+        print(f"{thread.name}: Working concurrently as {self.user.value}")
+        # per-thread state that accumulates as long as the thread lives
+        self.user.cache.append(bytearray(2**20))
+        sleep(1)  # To allow for worker threads to be reused
+
+
+class SessionPool(object):
+    def __init__(self):
+        self.num_of_threads = 2
+        self.session = Session()
+        self.executor = RecyclingExecutor(max_workers=self.num_of_threads,
+                                          initializer=self.initializer,
+                                          max_tasks=3, max_rss_growth=None)
+
+    def initializer(self):
+        thread = current_thread()
+        print(f"+++ {thread.name} initializer +++")
+        self.session.init_thread()
+
+    def work_as_admin(self):
+        try:
+            self.session.set_user(User.ADMIN)
+            self.session.work_thread()
+        finally:
+            self.session.set_user_as_guest()
+
+    def work_as_guest(self):
+        """Uses the default user (GUEST) to perform a task"""
+        self.session.work_thread()
+
+    def execute_task(self, task):
+        return self.executor.submit(task)
+
+
+#####################
+# exploiting above code example
+#####################
+sp = SessionPool()
+futures = [sp.execute_task(sp.work_as_admin if i % 3 == 0 else sp.work_as_guest)
+           for i in range(9)]
+
+# To prevent the main thread from stopping before worker threads finish
+wait(futures)
+for future in futures:
+    future.result()
+sp.executor.shutdown()
+print(f"Recycle counters: {dict(sp.executor.stats)}")
+
+
+def broken_initializer():
+    raise OSError("session store not reachable")
+
+
+broken_executor = RecyclingExecutor(max_workers=1, initializer=broken_initializer)
+try:
+    broken_executor.submit(sp.work_as_guest).result()
+except BrokenThreadPool as error:
+    print(f"Broken pool: {error}, caused by {error.__cause__!r}")
+broken_executor.shutdown()
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: OpenSSF project contributors
+# SPDX-License-Identifier: MIT
+""" Code Example """
+import statistics
+import timeit
+from contextvars import ContextVar, copy_context
+from enum import Enum
+from threading import local
+
+TASKS = 100_000
+REPEATS = 9
+
+
+class User(Enum):
+    GUEST = 1
+    ADMIN = 2
+
+
+thread_user = local()
+thread_user.value = User.GUEST
+context_user = ContextVar("context_user", default=User.GUEST)
+
+
+def reset_task():
+    """ compliant02.py: reinitialize before performing the task """
+    thread_user.value = User.GUEST
+    thread_user.value = User.ADMIN
+    return thread_user.value
+
+
+def finally_task():
+    """ compliant01.py: reset after performing the task """
+    try:
+        thread_user.value = User.ADMIN
+        return thread_user.value
+    finally:
+        thread_user.value = User.GUEST
+
+
+def context_task():
+    """ compliant03.py: the change is discarded together with the copied context """
+    context_user.set(User.ADMIN)
+    return context_user.get()
+
+
+def context_run():
+    """ What SessionPool.execute_task() of compliant03.py submits """
+    return copy_context().run(context_task)
+
+
+APPROACHES = (("reset", reset_task), ("finally", finally_task), ("contextvars", context_run))
+
+
+def empty_task():
+    """ Baseline: the cost of calling a task that does nothing """
+    return User.ADMIN
+
+
+print(f"{'approach':<12} {'median':>9} {'min':>9}")
+for name, task in (("empty task", empty_task),) + APPROACHES:
+    runs = [seconds / TASKS for seconds in timeit.repeat(task, number=TASKS, repeat=REPEATS)]
+    print(f"{name:<12} {statistics.median(runs) * 1e9:>6.0f} ns {min(runs) * 1e9:>6.0f} ns")